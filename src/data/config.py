@@ -116,6 +116,7 @@ class ConfigManager:
             log_dir=logging_cfg.get("directory", "logs"),
             save_screenshots=logging_cfg.get("screenshots", True),
             screenshot_dir=logging_cfg.get("screenshot_dir", "screenshots"),
+            profile_runs=logging_cfg.get("profile_runs", False),
         )
 
         # Merge hotkeys with defaults
@@ -296,6 +297,7 @@ class ConfigManager:
                 "directory": config.log_dir,
                 "screenshots": config.save_screenshots,
                 "screenshot_dir": config.screenshot_dir,
+                "profile_runs": config.profile_runs,
             },
             "hotkeys": config.hotkeys,
         }
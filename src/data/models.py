@@ -71,6 +71,7 @@ class Config:
     log_dir: str = "logs"
     save_screenshots: bool = True
     screenshot_dir: str = "screenshots"
+    profile_runs: bool = False  # cProfile each run, dump stats to log_dir
 
     # Hotkeys (D2R defaults)
     hotkeys: Dict[str, str] = field(default_factory=lambda: {
@@ -64,6 +64,7 @@ class HealthMonitor:
 
     # Hardcoded Save & Exit button position for 1920x1080
     SAVE_EXIT_BUTTON_POS = (960, 540)
+    SAVE_EXIT_X, SAVE_EXIT_Y = SAVE_EXIT_BUTTON_POS
 
     def __init__(
         self,
@@ -106,9 +107,12 @@ class HealthMonitor:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        self._armed = threading.Event()
+        self.chicken_event = threading.Event()  # Set when chicken triggers
         self.check_interval = 0.1  # 100ms between checks
         self._start_time = time.time()  # Initialize to current time
         self._grace_period = 2.0  # Don't trigger chicken in first 2 seconds
+        self.max_reading_age = 0.25  # Reuse monitor readings younger than this
 
         # Callbacks
         self._on_chicken: Optional[Callable] = None
@@ -137,7 +141,9 @@ class HealthMonitor:
 
         self._running = True
         self.state.chicken_triggered = False
+        self.chicken_event.clear()
         self._start_time = time.time()
+        self._armed.set()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
         self.log.info(f"Health monitor started (chicken at {self.chicken_health}%)")
@@ -148,13 +154,39 @@ class HealthMonitor:
             return
 
         self._running = False
+        self._armed.set()  # Wake the loop so it can exit
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
+        self._armed.clear()
         self.log.info("Health monitor stopped")
 
+    def arm(self) -> None:
+        """
+        Resume health checks for a run.
+
+        Launches the monitor thread on first use and keeps it alive
+        afterwards, so per-run arm/disarm only toggles a flag.
+        """
+        self.reset_chicken_flag()
+        self._start_time = time.time()
+        if not self._running:
+            self.start_monitoring()
+            return
+        self._armed.set()
+
+    def disarm(self) -> None:
+        """Pause health checks without stopping the monitor thread."""
+        self._armed.clear()
+
+    def is_armed(self) -> bool:
+        """Check if health checks are currently active."""
+        return self._armed.is_set()
+
     def _monitor_loop(self) -> None:
         """Main monitoring loop (runs in background thread)."""
         while self._running:
+            if not self._armed.wait(self.check_interval) or not self._running:
+                continue
             try:
                 self._check_and_respond()
                 time.sleep(self.check_interval)
@@ -299,6 +331,28 @@ class HealthMonitor:
 
         return status != HealthStatus.CRITICAL
 
+    def is_safe(self) -> bool:
+        """
+        Check if health is safe, reusing the monitor thread's reading.
+
+        While the background loop is armed and its last reading is fresh,
+        this is a pure state read with no screen capture. Otherwise it
+        falls back to a synchronous check_health().
+
+        Returns:
+            True if safe, False if should chicken
+        """
+        if self._running and self._armed.is_set():
+            state = self.state
+            now = time.time()
+            if now - state.last_check_time <= self.max_reading_age:
+                if state.status != HealthStatus.CRITICAL:
+                    return True
+                # Same grace period rule as check_health()
+                return now - self._start_time < self._grace_period
+
+        return self.check_health()
+
     def get_health_percent(self) -> float:
         """Get current health percentage."""
         return self.state.health_percent
@@ -357,6 +411,7 @@ class HealthMonitor:
             if self.state.chicken_triggered:
                 return
             self.state.chicken_triggered = True
+            self.chicken_event.set()
 
         self.log.warning(f"CHICKEN! Reason: {reason}")
 
@@ -403,10 +458,7 @@ class HealthMonitor:
         # Method 2: Press Escape to open menu, click Save & Exit at known position
         self.input.press("escape")
         time.sleep(0.5)
-        self.input.click(
-            self.SAVE_EXIT_BUTTON_POS[0],
-            self.SAVE_EXIT_BUTTON_POS[1],
-        )
+        self.input.click(self.SAVE_EXIT_X, self.SAVE_EXIT_Y)
         time.sleep(0.5)
 
         # Method 3: Press Escape again as last resort (closes menu or triggers exit)
@@ -427,6 +479,7 @@ class HealthMonitor:
         """Reset chicken triggered flag (after rejoining game)."""
         with self._lock:
             self.state.chicken_triggered = False
+            self.chicken_event.clear()
 
     def is_monitoring(self) -> bool:
         """Check if monitoring is active."""
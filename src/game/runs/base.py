@@ -1,14 +1,20 @@
 """Base class for farming runs."""
 
+import cProfile
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional, Callable, List
+from pathlib import Path
+from typing import Dict, Final, Iterator, Optional, Callable, List
+
+import cv2
+import numpy as np
 
 from src.data.models import Config
 from src.input.controller import InputController
-from src.game.combat import SorceressCombat
+from src.game.combat import SorceressCombat, Skill
 from src.game.health import HealthMonitor
 from src.game.town import TownManager
 from src.utils.logger import get_logger
@@ -24,7 +30,7 @@ class RunStatus(Enum):
     ABORTED = auto()       # User aborted
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     """Result of a farming run."""
     status: RunStatus
@@ -32,7 +38,7 @@ class RunResult:
     kills: int = 0
     items_picked: int = 0
     error_message: str = ""
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = 0.0  # Stamped by BaseRun.execute() on completion
 
 
 class BaseRun(ABC):
@@ -46,8 +52,57 @@ class BaseRun(ABC):
     - Result tracking
     """
 
+    __slots__ = (
+        "config",
+        "input",
+        "combat",
+        "_health",
+        "_has_health",
+        "_chicken_event",
+        "town",
+        "detector",
+        "capture",
+        "_menu",
+        "_has_menu",
+        "loot",
+        "log",
+        "_running",
+        "_start_time",
+        "_run_history",
+        "_success_count",
+        "_chicken_count",
+        "_success_time_sum",
+        "_phase_times",
+        "_on_run_complete",
+        "_on_chicken",
+        "run_timeout",
+        "cast_settle_time",
+    )
+
     # Hardcoded Save & Exit button position for 1920x1080
-    SAVE_EXIT_BUTTON_POS = (960, 540)
+    SAVE_EXIT_BUTTON_POS: Final = (960, 540)
+
+    # Escape -> Save & Exit -> Escape fallback, as (action, arg, delay) steps
+    EXIT_SEQUENCE: Final = (
+        ("press", "escape", 0.5),
+        ("click", SAVE_EXIT_BUTTON_POS, 0.5),
+        ("press", "escape", 0.3),
+    )
+
+    # Frame-change probe for _wait_for_frame_stable(): downsampled size and
+    # mean absolute gray-level change below which the screen has settled
+    FRAME_PROBE_SIZE: Final = (96, 54)
+    FRAME_STABLE_THRESHOLD: Final = 2.0
+
+    # Fraction of the timeout always waited before the first comparison;
+    # right after a cast the animation hasn't started rendering yet
+    FRAME_MIN_DWELL: Final = 0.5
+
+    # Post-cast settle time for skills faster than cast_settle_time (seconds);
+    # other skills use cast_settle_time
+    SKILL_SETTLE: Final = {
+        Skill.STATIC_FIELD: 0.12,
+    }
 
     def __init__(
         self,
@@ -90,6 +145,10 @@ class BaseRun(ABC):
         self._running = False
         self._start_time: float = 0.0
         self._run_history: List[RunResult] = []
+        self._success_count: int = 0
+        self._chicken_count: int = 0
+        self._success_time_sum: float = 0.0
+        self._phase_times: Dict[str, float] = {}
 
         # Callbacks
         self._on_run_complete: Optional[Callable] = None
@@ -97,6 +156,28 @@ class BaseRun(ABC):
 
         # Timeouts
         self.run_timeout: float = 120.0  # Max run time in seconds
+        self.cast_settle_time: float = 0.3  # Max wait after a cast
+
+    @property
+    def health(self) -> Optional[HealthMonitor]:
+        """Health monitor (None when health checks are disabled)."""
+        return self._health
+
+    @health.setter
+    def health(self, monitor: Optional[HealthMonitor]) -> None:
+        self._health = monitor
+        self._has_health = monitor is not None
+        self._chicken_event = monitor.chicken_event if monitor is not None else None
+
+    @property
+    def menu(self):
+        """Menu navigator used for Save & Exit (may be None)."""
+        return self._menu
+
+    @menu.setter
+    def menu(self, navigator) -> None:
+        self._menu = navigator
+        self._has_menu = navigator is not None
 
     def set_callbacks(
         self,
@@ -132,63 +213,108 @@ class BaseRun(ABC):
         Returns:
             RunResult with status and stats
         """
-        self.log.info(f"Starting {self.name} run")
+        log = self.log
+        info = log.info
+        error = log.error
+        name = self.name
+
+        info(f"Starting {name} run")
         self._running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
-        # Start health monitoring
-        if self.health:
-            self.health.reset_chicken_flag()
-            self.health.start_monitoring()
+        # Arm health monitoring (thread persists across runs)
+        has_health = self._has_health
+        if has_health:
+            self._health.arm()
 
         try:
-            result = self._execute_run()
+            if self.config.profile_runs:
+                result = self._profile_run()
+            else:
+                result = self._execute_run()
 
             # Check for chicken
-            if self.health and self.health.state.chicken_triggered:
+            chicken_event = self._chicken_event
+            if chicken_event is not None and chicken_event.is_set():
                 result = RunResult(
                     status=RunStatus.CHICKEN,
-                    run_time=time.time() - self._start_time,
                     error_message="Emergency exit triggered",
                 )
 
         except Exception as e:
-            self.log.error(f"{self.name} run error: {e}")
+            error(f"{name} run error: {e}")
             result = RunResult(
                 status=RunStatus.ERROR,
-                run_time=time.time() - self._start_time,
                 error_message=str(e),
             )
 
         finally:
             self._running = False
-            if self.health:
-                self.health.stop_monitoring()
+            if has_health:
+                self._health.disarm()
 
         # Record result
-        result.run_time = time.time() - self._start_time
+        result.run_time = time.monotonic() - self._start_time
+        result.timestamp = time.time()
         self._run_history.append(result)
+        status = result.status
+        if status is RunStatus.SUCCESS:
+            self._success_count += 1
+            self._success_time_sum += result.run_time
+        elif status is RunStatus.CHICKEN:
+            self._chicken_count += 1
 
-        self.log.info(
-            f"{self.name} run complete: {result.status.name} "
-            f"({result.run_time:.1f}s)"
-        )
+        info(f"{name} run complete: {status.name} ({result.run_time:.1f}s)")
 
         # Call callbacks
         if self._on_run_complete:
             try:
                 self._on_run_complete(result)
             except Exception as e:
-                self.log.error(f"Run complete callback error: {e}")
+                error(f"Run complete callback error: {e}")
 
-        if result.status == RunStatus.CHICKEN and self._on_chicken:
+        if status is RunStatus.CHICKEN and self._on_chicken:
             try:
                 self._on_chicken(result)
             except Exception as e:
-                self.log.error(f"Chicken callback error: {e}")
+                error(f"Chicken callback error: {e}")
 
         return result
 
+    def _profile_run(self) -> RunResult:
+        """Run _execute_run() under cProfile and dump stats to the log dir."""
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(self._execute_run)
+        finally:
+            profile_dir = Path(self.config.log_dir) / "profiles"
+            try:
+                profile_dir.mkdir(parents=True, exist_ok=True)
+                slug = self.name.lower().replace(" ", "_")
+                path = profile_dir / f"{slug}_{time.strftime('%Y%m%d_%H%M%S')}.prof"
+                profiler.dump_stats(str(path))
+                self.log.debug(f"Saved run profile to {path}")
+            except OSError as e:
+                self.log.warning(f"Could not save run profile: {e}")
+
+    @contextmanager
+    def _timer(self, phase: str) -> Iterator[None]:
+        """
+        Accumulate wall time spent in a run phase.
+
+        Usage: ``with self._timer("combat"): ...``
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._phase_times[phase] = self._phase_times.get(phase, 0.0) + elapsed
+
+    def get_phase_times(self) -> Dict[str, float]:
+        """Get accumulated seconds per run phase (e.g. town, combat, loot)."""
+        return self._phase_times.copy()
+
     def abort(self) -> None:
         """Abort the current run."""
         self.log.warning(f"Aborting {self.name} run")
@@ -202,14 +328,14 @@ class BaseRun(ABC):
         """Check if run has exceeded timeout."""
         if not self._running:
             return False
-        elapsed = time.time() - self._start_time
+        elapsed = time.monotonic() - self._start_time
         return elapsed > self.run_timeout
 
     def get_elapsed_time(self) -> float:
         """Get elapsed time of current run."""
         if not self._running:
             return 0.0
-        return time.time() - self._start_time
+        return time.monotonic() - self._start_time
 
     def get_run_history(self) -> List[RunResult]:
         """Get history of runs."""
@@ -221,29 +347,112 @@ class BaseRun(ABC):
 
     def get_success_count(self) -> int:
         """Get number of successful runs."""
-        return sum(1 for r in self._run_history if r.status == RunStatus.SUCCESS)
+        return self._success_count
 
     def get_chicken_count(self) -> int:
         """Get number of chicken runs."""
-        return sum(1 for r in self._run_history if r.status == RunStatus.CHICKEN)
+        return self._chicken_count
 
     def get_average_run_time(self) -> float:
         """Get average run time (successful runs only)."""
-        successful = [r for r in self._run_history if r.status == RunStatus.SUCCESS]
-        if not successful:
+        if not self._success_count:
             return 0.0
-        return sum(r.run_time for r in successful) / len(successful)
+        return self._success_time_sum / self._success_count
 
     def _check_health(self) -> bool:
         """
         Check if health is safe to continue.
 
+        Once the monitor has chickened this is a single flag read; otherwise
+        it defers to HealthMonitor.is_safe() (the monitor thread's reading).
+
         Returns:
             True if safe, False if should abort
         """
-        if not self.health:
+        if not self._has_health:
+            return True
+        if self._chicken_event.is_set():
+            return False
+        return self._health.is_safe()
+
+    def _wait(self, seconds: float) -> bool:
+        """
+        Sleep for a run delay, waking early if chicken triggers.
+
+        Args:
+            seconds: Delay in seconds
+
+        Returns:
+            True if the full delay elapsed, False if cut short by chicken
+        """
+        chicken_event = self._chicken_event
+        if chicken_event is None:
+            time.sleep(seconds)
             return True
-        return self.health.check_health()
+        return not chicken_event.wait(seconds)
+
+    def _wait_for_frame_stable(self, timeout: float, poll: float = 0.02) -> bool:
+        """
+        Wait until the screen stops changing, for at most ``timeout`` seconds.
+
+        Always waits FRAME_MIN_DWELL * timeout first, so a screen that has
+        not yet started changing isn't mistaken for a settled one. Falls
+        back to a plain _wait(timeout) when no screen capture is available.
+
+        Args:
+            timeout: Maximum delay in seconds (the old fixed sleep)
+            poll: Seconds between frame comparisons
+
+        Returns:
+            True if the screen settled or the timeout elapsed,
+            False if cut short by chicken
+        """
+        deadline = time.monotonic() + timeout
+        if not self._wait(timeout * self.FRAME_MIN_DWELL):
+            return False
+        prev = self._probe_frame()
+        if prev is None:
+            return self._wait(max(0.0, deadline - time.monotonic()))
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if not self._wait(min(poll, remaining)):
+                return False
+
+            curr = self._probe_frame()
+            if curr is None:
+                return self._wait(max(0.0, deadline - time.monotonic()))
+            if cv2.absdiff(curr, prev).mean() < self.FRAME_STABLE_THRESHOLD:
+                return True
+            prev = curr
+
+    def _settle_after(self, skill: Skill) -> bool:
+        """
+        Wait for a cast of ``skill`` to settle.
+
+        Uses the skill's SKILL_SETTLE time, capped by cast_settle_time.
+
+        Returns:
+            False if cut short by chicken
+        """
+        cap = self.cast_settle_time
+        return self._wait_for_frame_stable(min(self.SKILL_SETTLE.get(skill, cap), cap))
+
+    def _probe_frame(self) -> Optional[np.ndarray]:
+        """Grab a small grayscale copy of the screen for change detection."""
+        if self.capture is None:
+            return None
+
+        frame = self.capture.grab(use_cache=False)
+        if not isinstance(frame, np.ndarray):
+            return None
+
+        small = cv2.resize(frame, self.FRAME_PROBE_SIZE, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
 
     def _grab_screen(self):
         """Grab current screen if capture available."""
@@ -260,20 +469,12 @@ class BaseRun(ABC):
         """
         self.log.info("Exiting game")
 
-        if self.menu is not None:
+        if self._has_menu:
             try:
-                if self.menu.exit_game():
+                if self._menu.exit_game():
                     return
                 self.log.warning("Menu navigator exit_game failed, trying fallback")
             except Exception as e:
                 self.log.error(f"Menu navigator error during exit: {e}")
 
-        self.input.press("escape")
-        time.sleep(0.5)
-        self.input.click(
-            self.SAVE_EXIT_BUTTON_POS[0],
-            self.SAVE_EXIT_BUTTON_POS[1],
-        )
-        time.sleep(0.5)
-        self.input.press("escape")
-        time.sleep(0.3)
+        self.input.send_sequence(self.EXIT_SEQUENCE)
@@ -6,9 +6,12 @@ managing area progression, difficulty transitions, and run execution.
 
 import time
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.data.models import Build, Config
 from src.game.combat import SorceressCombat
 from src.game.health import HealthMonitor
@@ -22,34 +25,44 @@ from .base import BaseRun, RunResult, RunStatus
 
 # ========== Leveling Phases ==========
 
-class Difficulty(Enum):
-    """Game difficulties."""
-    NORMAL = "normal"
-    NIGHTMARE = "nightmare"
-    HELL = "hell"
+class Difficulty(IntEnum):
+    """Game difficulties (values index per-difficulty tables)."""
+    NORMAL = 0
+    NIGHTMARE = 1
+    HELL = 2
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in logs, stats and saved state."""
+        return self.name.lower()
 
 
-class LevelingPhase(Enum):
+class LevelingPhase(IntEnum):
     """Leveling phases with associated level ranges and activities."""
     # Normal difficulty
-    BLOOD_MOOR = "blood_moor"              # 1-8: Blood Moor grinding (true level 1 start)
-    NORMAL_EARLY = "normal_early"          # 8-15: Tristram/Countess runs
-    NORMAL_TOMBS = "normal_tombs"          # 13-20: Tal Rasha's Tombs
-    NORMAL_COWS = "normal_cows"            # 20-25: Cow Level
-    NORMAL_BAAL = "normal_baal"            # 25-40: Normal Baal runs
+    BLOOD_MOOR = 0          # 1-8: Blood Moor grinding (true level 1 start)
+    NORMAL_EARLY = 1        # 8-15: Tristram/Countess runs
+    NORMAL_TOMBS = 2        # 13-20: Tal Rasha's Tombs
+    NORMAL_COWS = 3         # 20-25: Cow Level
+    NORMAL_BAAL = 4         # 25-40: Normal Baal runs
 
     # Nightmare difficulty
-    NIGHTMARE_BAAL = "nightmare_baal"      # 41-60: Nightmare Baal runs
+    NIGHTMARE_BAAL = 5      # 41-60: Nightmare Baal runs
 
     # Hell difficulty
-    HELL_CHAOS = "hell_chaos"              # 60-70: Hell Chaos Sanctuary
-    HELL_BAAL = "hell_baal"               # 70-75+: Hell Baal runs
+    HELL_CHAOS = 6          # 60-70: Hell Chaos Sanctuary
+    HELL_BAAL = 7           # 70-75+: Hell Baal runs
 
     # Endgame farming (post-leveling)
-    ENDGAME_FARMING = "endgame_farming"    # 75+: Pindle/Mephisto farming
+    ENDGAME_FARMING = 8     # 75+: Pindle/Mephisto farming
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in logs, stats and saved state."""
+        return self.name.lower()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PhaseConfig:
     """Configuration for a leveling phase."""
     phase: LevelingPhase
@@ -61,8 +74,8 @@ class PhaseConfig:
     waypoint_act_tab: Tuple[int, int]    # Position of act tab in WP menu
     waypoint_destination: Tuple[int, int]  # Position of destination WP
     combat_style: str            # "nova", "blizzard", "static_blizzard"
-    teleport_targets: List[Tuple[int, int]]  # Positions to teleport to
-    clear_positions: List[Tuple[int, int]]   # Positions to attack
+    teleport_targets: Tuple[Tuple[int, int], ...]  # Positions to teleport to
+    clear_positions: Tuple[Tuple[int, int], ...]   # Positions to attack
     run_timeout: float = 120.0
 
 
@@ -79,13 +92,13 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(260, 120),  # Not used - no waypoint needed
         waypoint_destination=(260, 170),  # Rogue Encampment (starting point)
         combat_style="basic",  # Just walk and attack, no teleport
-        teleport_targets=[],  # No teleport at level 1
-        clear_positions=[
+        teleport_targets=(),  # No teleport at level 1
+        clear_positions=(
             # Walk around Blood Moor entrance area
             (960, 450), (850, 400), (1070, 400),
             (960, 350), (800, 350), (1120, 350),
             (900, 500), (1020, 500),
-        ],
+        ),
         run_timeout=180.0,  # Longer timeout for walking
     ),
 
@@ -99,13 +112,13 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(260, 120),
         waypoint_destination=(260, 220),     # Stony Field -> Tristram portal
         combat_style="nova",
-        teleport_targets=[
+        teleport_targets=(
             (960, 400), (960, 300),          # North toward Tristram portal
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 350), (800, 350), (1100, 350),
             (960, 250), (800, 250), (1100, 250),
-        ],
+        ),
         run_timeout=90.0,
     ),
 
@@ -119,13 +132,13 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(350, 120),         # Act 2 tab
         waypoint_destination=(350, 370),     # Canyon of the Magi
         combat_style="nova",
-        teleport_targets=[
+        teleport_targets=(
             (960, 350), (960, 250), (960, 150),
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 300), (750, 300), (1150, 300),
             (960, 200), (750, 200), (1150, 200),
-        ],
+        ),
         run_timeout=120.0,
     ),
 
@@ -139,14 +152,14 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(260, 120),
         waypoint_destination=(260, 170),     # Rogue Encampment
         combat_style="nova",
-        teleport_targets=[
+        teleport_targets=(
             (960, 400), (960, 300),
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 350), (700, 350), (1200, 350),
             (960, 200), (700, 200), (1200, 200),
             (500, 350), (1400, 350),
-        ],
+        ),
         run_timeout=180.0,
     ),
 
@@ -160,14 +173,14 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(590, 120),         # Act 5 tab
         waypoint_destination=(590, 370),     # Worldstone Keep Level 2
         combat_style="nova",
-        teleport_targets=[
+        teleport_targets=(
             (960, 350), (960, 250), (960, 150),
             (960, 350), (960, 250),
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 300), (750, 300), (1150, 300),
             (960, 200), (750, 200), (1150, 200),
-        ],
+        ),
         run_timeout=180.0,
     ),
 
@@ -181,13 +194,13 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(590, 120),
         waypoint_destination=(590, 370),
         combat_style="blizzard",
-        teleport_targets=[
+        teleport_targets=(
             (960, 350), (960, 250), (960, 150),
             (960, 350), (960, 250),
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 300), (750, 300), (1150, 300),
-        ],
+        ),
         run_timeout=240.0,
     ),
 
@@ -201,14 +214,14 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(480, 120),         # Act 4 tab
         waypoint_destination=(480, 220),     # River of Flame
         combat_style="static_blizzard",
-        teleport_targets=[
+        teleport_targets=(
             (960, 350), (960, 250), (960, 150),
             (1100, 300), (800, 300),
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 300), (750, 300), (1150, 300),
             (960, 200), (600, 350), (1300, 350),
-        ],
+        ),
         run_timeout=300.0,
     ),
 
@@ -222,17 +235,76 @@ PHASE_CONFIGS: Dict[LevelingPhase, PhaseConfig] = {
         waypoint_act_tab=(590, 120),
         waypoint_destination=(590, 370),
         combat_style="static_blizzard",
-        teleport_targets=[
+        teleport_targets=(
             (960, 350), (960, 250), (960, 150),
             (960, 350), (960, 250),
-        ],
-        clear_positions=[
+        ),
+        clear_positions=(
             (960, 300), (750, 300), (1150, 300),
-        ],
+        ),
         run_timeout=300.0,
     ),
 }
 
+
+def _resolve_phase(difficulty: Difficulty, level: int) -> LevelingPhase:
+    """Pick the leveling phase for a difficulty and character level."""
+    if difficulty == Difficulty.HELL:
+        if level >= 70:
+            return LevelingPhase.HELL_BAAL
+        return LevelingPhase.HELL_CHAOS
+
+    if difficulty == Difficulty.NIGHTMARE:
+        return LevelingPhase.NIGHTMARE_BAAL
+
+    # Normal difficulty
+    if level >= 25:
+        return LevelingPhase.NORMAL_BAAL
+    if level >= 20:
+        return LevelingPhase.NORMAL_COWS
+    if level >= 13:
+        return LevelingPhase.NORMAL_TOMBS
+    if level >= 8:
+        return LevelingPhase.NORMAL_EARLY
+    return LevelingPhase.BLOOD_MOOR
+
+
+MAX_CHARACTER_LEVEL = 99
+
+# Phase config lookup: _PHASE_TABLE[difficulty][level]
+_PHASE_TABLE: Tuple[Tuple[PhaseConfig, ...], ...] = tuple(
+    tuple(
+        PHASE_CONFIGS[_resolve_phase(diff, level)]
+        for level in range(MAX_CHARACTER_LEVEL + 1)
+    )
+    for diff in Difficulty
+)
+
+
+# Resolution the phase positions are authored for
+BASE_RESOLUTION = (1920, 1080)
+
+
+@lru_cache(maxsize=None)
+def scale_positions(
+    positions: Tuple[Tuple[int, int], ...],
+    resolution: Tuple[int, int],
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    Scale 1920x1080 screen positions to another resolution.
+
+    Scaling is done once per (positions, resolution) pair as an int16
+    array operation; callers get back plain int tuples for their loops.
+    """
+    if not positions or resolution == BASE_RESOLUTION:
+        return positions
+
+    scale = (resolution[0] / BASE_RESOLUTION[0], resolution[1] / BASE_RESOLUTION[1])
+    # Round to the nearest pixel; a bare cast would truncate toward 0,0
+    scaled = np.rint(np.asarray(positions, dtype=np.int16) * scale).astype(np.int16)
+    return tuple(tuple(pos) for pos in scaled.tolist())
+
+
 # Difficulty transition requirements
 DIFFICULTY_TRANSITIONS = {
     Difficulty.NIGHTMARE: {
@@ -246,7 +318,7 @@ DIFFICULTY_TRANSITIONS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class LevelingState:
     """Persistent state for the leveling journey."""
     current_level: int = 1
@@ -300,10 +372,32 @@ class LevelingRun(BaseRun):
         self.run_timeout = phase_config.run_timeout
         self.log = get_logger()
 
+    @property
+    def phase(self) -> PhaseConfig:
+        """Phase configuration driving this run."""
+        return self._phase
+
+    @phase.setter
+    def phase(self, phase_config: PhaseConfig) -> None:
+        self._phase = phase_config
+        resolution = tuple(self.config.resolution)
+        self._teleport_targets = scale_positions(tuple(phase_config.teleport_targets), resolution)
+        self._clear_positions = scale_positions(tuple(phase_config.clear_positions), resolution)
+
     @property
     def name(self) -> str:
         return f"Leveling ({self.phase.area})"
 
+    def reset_state(self) -> None:
+        """Clear per-run bookkeeping so a pooled instance starts fresh."""
+        self._running = False
+        self._start_time = 0.0
+        self._run_history.clear()
+        self._success_count = 0
+        self._chicken_count = 0
+        self._success_time_sum = 0.0
+        self._phase_times.clear()
+
     def _execute_run(self) -> RunResult:
         kills = 0
         items = 0
@@ -323,7 +417,7 @@ class LevelingRun(BaseRun):
         # Step 2: Buffs
         if self.combat:
             self.combat.ensure_buffs()
-            time.sleep(0.3)
+            self._wait(0.3)
 
         # Step 3: Waypoint to leveling area
         if not self._waypoint_to_area():
@@ -332,7 +426,8 @@ class LevelingRun(BaseRun):
                 error_message=f"Could not waypoint to {self.phase.area}",
             )
         self.log.info("Waypoint complete, waiting for zone load...")
-        time.sleep(1.5)
+        if not self._wait(1.5):
+            return RunResult(status=RunStatus.CHICKEN)
 
         self.log.info("Checking health before combat...")
         if not self._check_health():
@@ -344,7 +439,8 @@ class LevelingRun(BaseRun):
 
         # Step 5: Clear area with appropriate combat style
         self.log.info("Step 5: Clearing area")
-        kills = self._clear_area()
+        with self._timer("combat"):
+            kills = self._clear_area()
         self.log.info(f"Area cleared, kills: {kills}")
 
         if not self._check_health():
@@ -352,8 +448,10 @@ class LevelingRun(BaseRun):
 
         # Step 6: Loot
         self.log.info("Step 6: Looting")
-        time.sleep(0.8)
-        items = self._loot_area()
+        with self._timer("loot"):
+            if not self._wait(0.8):
+                return RunResult(status=RunStatus.CHICKEN, kills=kills)
+            items = self._loot_area()
         self.log.info(f"Loot complete, items: {items}")
 
         # Step 7: Save & Exit for fast restart
@@ -383,8 +481,10 @@ class LevelingRun(BaseRun):
             self.input.click(1200, 400)  # Click right side to face Blood Moor exit
             time.sleep(0.3)
             self.input.key_down("w")  # Start walking forward
-            time.sleep(2.0)  # Walk for 2 seconds
+            walked = self._wait(2.0)  # Walk for 2 seconds (cut short on chicken)
             self.input.key_up("w")
+            if not walked:
+                return False
             self.log.info("Left town, now in Blood Moor")
             return True
 
@@ -426,16 +526,21 @@ class LevelingRun(BaseRun):
             return
 
         # Skip if no teleport targets (e.g., level 1 phase)
-        if not self.phase.teleport_targets:
+        if not self._teleport_targets:
             self.log.info("No teleport targets - skipping teleport phase")
             return
 
         self.log.info("Teleporting to mobs")
-        for pos in self.phase.teleport_targets:
-            if not self._check_health():
+        targets = self._teleport_targets
+        check = self._check_health
+        wait = self._wait
+        cast_teleport = self.combat.cast_teleport
+        for pos in targets:
+            if not check():
+                return
+            cast_teleport(pos)
+            if not wait(0.2):
                 return
-            self.combat.cast_teleport(pos)
-            time.sleep(0.2)
 
     def _clear_area(self) -> int:
         """Clear the area using the phase's combat style."""
@@ -459,23 +564,38 @@ class LevelingRun(BaseRun):
     def _clear_with_basic(self) -> int:
         """Clear using basic attacks (level 1, no teleport)."""
         kills = 0
-        self.log.info("Using basic combat - walking and attacking")
-
-        for pos in self.phase.clear_positions:
-            if not self._check_health():
+        log = self.log
+        log.info("Using basic combat - walking and attacking")
+
+        positions = self._clear_positions
+        check = self._check_health
+        wait = self._wait
+        input_ctrl = self.input
+        click = input_ctrl.click
+        for pos in positions:
+            if not check():
                 break
+            x, y = pos
 
             # Click to move to position
-            self.log.debug(f"Moving to {pos}")
-            self.input.click(pos[0], pos[1])
-            time.sleep(1.0)  # Wait for movement
+            log.debug(f"Moving to {pos}")
+            click(x, y)
+            if not wait(1.0):  # Wait for movement
+                break
 
             # Attack nearby enemies (shift+left click to stand and attack)
-            self.input.key_down("shift")
-            for _ in range(3):  # Attack a few times
-                self.input.click(pos[0] + 50, pos[1], button="left")
-                time.sleep(0.3)
-            self.input.key_up("shift")
+            interrupted = False
+            input_ctrl.key_down("shift")
+            try:
+                for _ in range(3):  # Attack a few times
+                    click(x + 50, y, button="left")
+                    if not wait(0.3):
+                        interrupted = True
+                        break
+            finally:
+                input_ctrl.key_up("shift")
+            if interrupted:
+                break
 
             kills += 1  # Approximate
 
@@ -484,70 +604,110 @@ class LevelingRun(BaseRun):
     def _clear_with_nova(self) -> int:
         """Clear using Nova (early leveling)."""
         kills = 0
-        for pos in self.phase.clear_positions:
-            if not self._check_health():
+        positions = self._clear_positions
+        check = self._check_health
+        wait = self._wait
+        cast_teleport = self.combat.cast_teleport
+        cast_nova = self.combat.cast_nova
+        for pos in positions:
+            if not check():
                 break
             # Teleport to pack, cast Nova
-            self.combat.cast_teleport(pos)
-            time.sleep(0.15)
-            self.combat.cast_nova()
-            time.sleep(0.2)
-            self.combat.cast_nova()
-            time.sleep(0.2)
+            cast_teleport(pos)
+            if not wait(0.15):
+                break
+            cast_nova()
+            if not wait(0.2):
+                break
+            cast_nova()
             kills += 1  # Approximate
+            if not wait(0.2):
+                break
 
         return kills
 
     def _clear_with_blizzard(self) -> int:
         """Clear using Blizzard (mid-game)."""
         kills = 0
-        for pos in self.phase.clear_positions:
-            if not self._check_health():
+        positions = self._clear_positions
+        check = self._check_health
+        wait = self._wait
+        cast_blizzard = self.combat.cast_blizzard
+        for pos in positions:
+            if not check():
                 break
-            self.combat.cast_blizzard(pos)
-            time.sleep(0.3)
+            cast_blizzard(pos)
             kills += 1
+            if not wait(0.3):
+                break
 
         # Wait for Blizzard damage
-        time.sleep(2.5)
+        wait(2.5)
         return kills
 
     def _clear_with_static_blizzard(self) -> int:
         """Clear using Static Field + Blizzard (Hell difficulty bosses)."""
         kills = 0
+        combat = self.combat
+        check = self._check_health
+        wait = self._wait
 
         # Static Field to weaken everything first
+        cast_static_field = combat.cast_static_field
         for _ in range(3):
-            if not self._check_health():
+            if not check():
+                break
+            cast_static_field()
+            if not wait(0.3):
                 break
-            self.combat.cast_static_field()
-            time.sleep(0.3)
 
         # Then Blizzard the area
-        for pos in self.phase.clear_positions:
-            if not self._check_health():
+        positions = self._clear_positions
+        cast_blizzard = combat.cast_blizzard
+        for pos in positions:
+            if not check():
                 break
-            self.combat.cast_blizzard(pos)
-            time.sleep(0.3)
+            cast_blizzard(pos)
             kills += 1
+            if not wait(0.3):
+                break
 
-        time.sleep(3.0)
+        wait(3.0)
         return kills
 
     def _loot_area(self) -> int:
         if self.loot:
             return self.loot.pickup_all_valid()
 
-        # Fallback
-        self.input.key_down("alt")
-        time.sleep(0.3)
-        for pos in self.phase.clear_positions[:3]:
-            self.input.click(pos[0], pos[1])
-            time.sleep(0.15)
-        self.input.key_up("alt")
+        # Fallback: click the first clear positions with item labels shown
+        self.input.click_batch(
+            self._clear_positions[:3],
+            interval=0.15,
+            modifier="alt",
+        )
         return 0
 
 
+# get_progress() layout; the footer rule is appended after the optional
+# build progress block
+_PROGRESS_RULE = "=" * 40
+_PROGRESS_TMPL = (
+    f"{_PROGRESS_RULE}\n"
+    "  LEVELING PROGRESS\n"
+    f"{_PROGRESS_RULE}\n"
+    "  Level:      {level} / {target}\n"
+    "  Difficulty: {difficulty}\n"
+    "  Phase:      {phase}\n"
+    "  Area:       {area}\n"
+    "  Runs:       {total_runs} total, {runs_in_phase} in phase\n"
+    "  Deaths:     {deaths}\n"
+)
+
+
+def _noop(*args, **kwargs) -> None:
+    """Stand-in for optional hooks whose dependency was not provided."""
+
+
 class LevelingManager:
     """
     Orchestrates the full leveling journey from level 1 to 75+.
@@ -590,10 +750,25 @@ class LevelingManager:
         self.stats = statistics
         self.log = get_logger()
 
+        # Optional hooks, bound once so the session loop calls them directly
+        has_leveler = level_manager is not None
+        self._maybe_respec = self._do_respec if has_leveler else _noop
+        self._maybe_handle_levelups = (
+            self._handle_pending_levelups
+            if has_leveler and screen_capture is not None
+            else _noop
+        )
+        self._record_stats = self._record_run_stats if statistics is not None else _noop
+
         # State
         self.state = LevelingState()
         self._running = False
         self._current_run: Optional[LevelingRun] = None
+        self._run_instance: Optional[LevelingRun] = None  # Reused across runs
+
+        # Last phase lookup as (level, difficulty, config). Keyed on the
+        # state values so direct writes to self.state stay correct.
+        self._cached_phase: Optional[Tuple[int, Difficulty, PhaseConfig]] = None
 
         # Settings
         self.runs_before_town = 5      # Town trip every N runs
@@ -604,33 +779,29 @@ class LevelingManager:
 
     def get_current_phase(self) -> LevelingPhase:
         """Determine the current leveling phase based on level and difficulty."""
-        level = self.state.current_level
-        diff = self.state.current_difficulty
-
-        if diff == Difficulty.HELL:
-            if level >= 70:
-                return LevelingPhase.HELL_BAAL
-            return LevelingPhase.HELL_CHAOS
-
-        if diff == Difficulty.NIGHTMARE:
-            return LevelingPhase.NIGHTMARE_BAAL
-
-        # Normal difficulty
-        if level >= 25:
-            return LevelingPhase.NORMAL_BAAL
-        if level >= 20:
-            return LevelingPhase.NORMAL_COWS
-        if level >= 13:
-            return LevelingPhase.NORMAL_TOMBS
-        if level >= 8:
-            return LevelingPhase.NORMAL_EARLY
-        return LevelingPhase.BLOOD_MOOR
+        return self._lookup_phase_config().phase
 
     def get_phase_config(self, phase: Optional[LevelingPhase] = None) -> PhaseConfig:
-        """Get configuration for a phase."""
-        phase = phase or self.get_current_phase()
+        """Get configuration for a phase (defaults to the current phase)."""
+        if phase is None:
+            return self._lookup_phase_config()
         return PHASE_CONFIGS[phase]
 
+    def _lookup_phase_config(self) -> PhaseConfig:
+        """Look up the current phase config, reusing the last result."""
+        state = self.state
+        level = state.current_level
+        difficulty = state.current_difficulty
+
+        cached = self._cached_phase
+        if cached is not None and cached[0] == level and cached[1] is difficulty:
+            return cached[2]
+
+        clamped = min(max(level, 0), MAX_CHARACTER_LEVEL)
+        phase_cfg = _PHASE_TABLE[difficulty][clamped]
+        self._cached_phase = (level, difficulty, phase_cfg)
+        return phase_cfg
+
     def should_progress_phase(self) -> bool:
         """Check if we should move to the next phase."""
         phase_cfg = self.get_phase_config()
@@ -676,8 +847,8 @@ class LevelingManager:
             return False
 
         self.log.info(
-            f"Transitioning from {self.state.current_difficulty.value} "
-            f"to {next_diff.value}"
+            f"Transitioning from {self.state.current_difficulty.label} "
+            f"to {next_diff.label}"
         )
 
         # In D2R, difficulty is selected at game creation.
@@ -688,33 +859,45 @@ class LevelingManager:
         # on the right difficulty.
 
         self.state.current_difficulty = next_diff
-        self.state.difficulty_unlocked[next_diff.value] = True
+        self.state.difficulty_unlocked[next_diff.label] = True
         self.state.runs_in_phase = 0
 
-        self.log.info(f"Now on {next_diff.value} difficulty")
+        self.log.info(f"Now on {next_diff.label} difficulty")
         return True
 
     # ========== Run Execution ==========
 
     def create_run(self) -> LevelingRun:
-        """Create a LevelingRun for the current phase."""
-        phase = self.get_current_phase()
-        phase_cfg = self.get_phase_config(phase)
-
-        self.state.current_phase = phase
-
-        run = LevelingRun(
-            phase_config=phase_cfg,
-            config=self.config,
-            input_ctrl=self.input,
-            combat=self.combat,
-            health_monitor=self.health,
-            town_manager=self.town,
-            game_detector=self.detector,
-            screen_capture=self.capture,
-            menu_navigator=self.menu,
-            loot_manager=self.loot,
-        )
+        """
+        Get the LevelingRun for the current phase.
+
+        The run instance is created once and reused; later calls rebind
+        it to the current phase and reset its per-run state.
+        """
+        phase_cfg = self.get_phase_config()
+
+        self.state.current_phase = phase_cfg.phase
+
+        run = self._run_instance
+        if run is None:
+            run = LevelingRun(
+                phase_config=phase_cfg,
+                config=self.config,
+                input_ctrl=self.input,
+                combat=self.combat,
+                health_monitor=self.health,
+                town_manager=self.town,
+                game_detector=self.detector,
+                screen_capture=self.capture,
+                menu_navigator=self.menu,
+                loot_manager=self.loot,
+            )
+            self._run_instance = run
+        else:
+            run.reset_state()
+            if run.phase is not phase_cfg:
+                run.phase = phase_cfg
+                run.run_timeout = phase_cfg.run_timeout
 
         return run
 
@@ -731,8 +914,8 @@ class LevelingManager:
         self.log.info(
             f"Leveling run #{self.state.total_runs + 1}: "
             f"Level {self.state.current_level}, "
-            f"{self.state.current_phase.value} "
-            f"({self.state.current_difficulty.value})"
+            f"{self.state.current_phase.label} "
+            f"({self.state.current_difficulty.label})"
         )
 
         result = run.execute()
@@ -752,15 +935,7 @@ class LevelingManager:
             self.state.total_deaths += 1
             self.log.warning(f"Death during run (total: {self.state.total_deaths})")
 
-        # Record stats
-        if self.stats:
-            self.stats.record_run(
-                run_type=f"leveling_{self.state.current_phase.value}",
-                status=result.status.name,
-                duration=result.run_time,
-                kills=result.kills,
-                items_picked=result.items_picked,
-            )
+        self._record_stats(result)
 
         self._current_run = None
         return result
@@ -790,7 +965,7 @@ class LevelingManager:
 
         self.log.info(
             f"Starting leveling session: Level {self.state.current_level} -> "
-            f"{self.target_level} ({self.state.current_difficulty.value})"
+            f"{self.target_level} ({self.state.current_difficulty.label})"
         )
 
         while self._running:
@@ -811,7 +986,7 @@ class LevelingManager:
             if self.state.runs_in_phase >= self.max_runs_per_phase:
                 self.log.warning(
                     f"Max runs per phase ({self.max_runs_per_phase}) reached "
-                    f"in {self.state.current_phase.value} - stopping"
+                    f"in {self.state.current_phase.label} - stopping"
                 )
                 break
 
@@ -820,12 +995,10 @@ class LevelingManager:
                 self.transition_difficulty()
 
             # Check for respec
-            if self.leveler and self.leveler.needs_respec():
-                self.log.info("Respec needed before continuing")
-                self.leveler.perform_respec()
+            self._maybe_respec()
 
             # Handle level-up point allocation
-            self._handle_pending_levelups()
+            self._maybe_handle_levelups()
 
             # Town trip every N runs
             if runs > 0 and runs % self.runs_before_town == 0:
@@ -861,6 +1034,22 @@ class LevelingManager:
 
     # ========== Support Methods ==========
 
+    def _do_respec(self) -> None:
+        """Perform a respec if the level manager says one is due."""
+        if self.leveler.needs_respec():
+            self.log.info("Respec needed before continuing")
+            self.leveler.perform_respec()
+
+    def _record_run_stats(self, result: RunResult) -> None:
+        """Record a finished run with the statistics tracker."""
+        self.stats.record_run(
+            run_type=f"leveling_{self.state.current_phase.label}",
+            status=result.status.name,
+            duration=result.run_time,
+            kills=result.kills,
+            items_picked=result.items_picked,
+        )
+
     def _handle_pending_levelups(self) -> None:
         """Check for and handle any pending level-ups."""
         if self.leveler is None:
@@ -891,7 +1080,7 @@ class LevelingManager:
     def set_difficulty(self, difficulty: Difficulty) -> None:
         """Set current difficulty."""
         self.state.current_difficulty = difficulty
-        self.log.info(f"Difficulty set to {difficulty.value}")
+        self.log.info(f"Difficulty set to {difficulty.label}")
 
     def set_target_level(self, level: int) -> None:
         """Set the target level to stop at."""
@@ -902,27 +1091,22 @@ class LevelingManager:
 
     def get_progress(self) -> str:
         """Get a formatted progress summary."""
-        phase_cfg = self.get_phase_config()
-
-        lines = [
-            "=" * 40,
-            "  LEVELING PROGRESS",
-            "=" * 40,
-            f"  Level:      {self.state.current_level} / {self.target_level}",
-            f"  Difficulty: {self.state.current_difficulty.value}",
-            f"  Phase:      {self.state.current_phase.value}",
-            f"  Area:       {phase_cfg.area}",
-            f"  Runs:       {self.state.total_runs} total, "
-            f"{self.state.runs_in_phase} in phase",
-            f"  Deaths:     {self.state.total_deaths}",
-        ]
+        state = self.state
+        progress = _PROGRESS_TMPL.format_map({
+            "level": state.current_level,
+            "target": self.target_level,
+            "difficulty": state.current_difficulty.label,
+            "phase": state.current_phase.label,
+            "area": self.get_phase_config().area,
+            "total_runs": state.total_runs,
+            "runs_in_phase": state.runs_in_phase,
+            "deaths": state.total_deaths,
+        })
 
         if self.leveler:
-            lines.append("")
-            lines.append(self.leveler.get_build_progress())
+            progress += f"\n{self.leveler.get_build_progress()}\n"
 
-        lines.append("=" * 40)
-        return "\n".join(lines)
+        return progress + _PROGRESS_RULE
 
     def is_running(self) -> bool:
         """Check if leveling session is active."""
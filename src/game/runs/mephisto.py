@@ -1,13 +1,13 @@
 """Mephisto farming run implementation."""
 
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 
 from src.data.models import Config
 from src.input.controller import InputController
-from src.game.combat import SorceressCombat
+from src.game.combat import SorceressCombat, Skill
 from src.game.health import HealthMonitor
 from src.game.town import TownManager
 from src.utils.logger import get_logger
@@ -43,7 +43,7 @@ class MephistoRun(BaseRun):
 
     # Teleport search directions for finding Level 3 entrance
     # Durance Level 2 is semi-random, so we teleport in a pattern
-    SEARCH_DIRECTIONS = [
+    SEARCH_DIRECTIONS = (
         (960, 300),    # North
         (1200, 300),   # North-East
         (1200, 540),   # East
@@ -52,23 +52,35 @@ class MephistoRun(BaseRun):
         (700, 700),    # South-West
         (700, 540),    # West
         (700, 300),    # North-West
-    ]
+    )
 
     # Moat trick positions (relative to Mephisto's platform)
     # After entering Level 3, Mephisto is on a central raised platform
     # We teleport to a position across the moat (southeast corner is common)
-    MOAT_POSITIONS = [
+    MOAT_POSITIONS = (
         (1100, 300),   # First moat position attempt
         (1150, 350),   # Slightly adjusted
         (1050, 280),   # Alternative angle
-    ]
+    )
 
     # Mephisto's expected position from moat trick spot
     MEPHISTO_TARGET = (800, 400)
 
+    # Fallback loot clicks around Mephisto's corpse (center, W, E, N, S)
+    LOOT_SCAN_POSITIONS = (
+        MEPHISTO_TARGET,
+        (MEPHISTO_TARGET[0] - 50, MEPHISTO_TARGET[1]),
+        (MEPHISTO_TARGET[0] + 50, MEPHISTO_TARGET[1]),
+        (MEPHISTO_TARGET[0], MEPHISTO_TARGET[1] - 40),
+        (MEPHISTO_TARGET[0], MEPHISTO_TARGET[1] + 40),
+    )
+
     # Max teleports before giving up on finding Level 3
     MAX_SEARCH_TELEPORTS = 25
 
+    # Level 3 entrance templates (tried in order)
+    STAIRS_TEMPLATES = ("objects/durance_stairs", "objects/durance_stairs_alt")
+
     def __init__(
         self,
         config: Optional[Config] = None,
@@ -109,6 +121,9 @@ class MephistoRun(BaseRun):
         # Run timeout for Mephisto (longer than Pindle)
         self.run_timeout = 180.0
 
+        # Grayscale stairs templates, loaded on first detection attempt
+        self._stairs_tmpls: Optional[List[np.ndarray]] = None
+
     @property
     def name(self) -> str:
         """Get run name."""
@@ -175,8 +190,9 @@ class MephistoRun(BaseRun):
             )
 
         # Step 7: Kill Mephisto
-        if self._kill_mephisto():
-            kills = 1
+        with self._timer("combat"):
+            if self._kill_mephisto():
+                kills = 1
 
         # Health check after combat
         if not self._check_health():
@@ -186,8 +202,9 @@ class MephistoRun(BaseRun):
             )
 
         # Step 8: Loot
-        time.sleep(1.5)  # Wait for drops
-        items = self._loot_area()
+        with self._timer("loot"):
+            time.sleep(1.5)  # Wait for drops
+            items = self._loot_area()
 
         # Step 9: Exit game
         self._exit_game()
@@ -252,39 +269,61 @@ class MephistoRun(BaseRun):
         if not self.combat:
             return False
 
-        search_start = time.time()
+        deadline = time.monotonic() + self.search_timeout
+        max_teleports = self.MAX_SEARCH_TELEPORTS
+        directions = self.SEARCH_DIRECTIONS
+        num_directions = len(directions)
+
+        # Bind per-iteration calls once
+        check_health = self._check_health
+        teleport_and_detect = self._teleport_and_detect
+
+        # Look before the first teleport, then while each teleport lands
+        found = self._detect_level_3_entrance()
         teleport_count = 0
-        direction_idx = 0
 
-        while teleport_count < self.MAX_SEARCH_TELEPORTS:
+        while not found:
+            if teleport_count >= max_teleports:
+                self.log.warning(f"Level 3 not found after {max_teleports} teleports")
+                return False
+
             # Check timeout
-            if time.time() - search_start > self.search_timeout:
+            if time.monotonic() > deadline:
                 self.log.warning("Search timeout - Level 3 not found")
                 return False
 
             # Health check during search
-            if not self._check_health():
+            if not check_health():
                 return False
 
-            # Check for Level 3 entrance on screen
-            if self._detect_level_3_entrance():
-                self.log.info("Found Level 3 entrance!")
-                return self._enter_level_3()
+            # Teleport in current direction (spiral pattern):
+            # change direction every 3 teleports
+            found = teleport_and_detect(directions[(teleport_count // 3) % num_directions])
+            teleport_count += 1
+
+        self.log.info("Found Level 3 entrance!")
+        return self._enter_level_3()
 
-            # Teleport in current direction
-            target = self.SEARCH_DIRECTIONS[direction_idx % len(self.SEARCH_DIRECTIONS)]
-            self.combat.cast_teleport(target)
-            time.sleep(0.2)
+    def _teleport_and_detect(self, target: Tuple[int, int], timeout: float = 0.2) -> bool:
+        """
+        Teleport toward a target and look for the Level 3 entrance once landed.
 
-            teleport_count += 1
+        Detection waits for the view to stop moving, so a match is never
+        taken (and clicked) from a frame that is still scrolling.
 
-            # Cycle through directions (spiral pattern)
-            # Change direction every 3 teleports
-            if teleport_count % 3 == 0:
-                direction_idx += 1
+        Args:
+            target: Teleport target position
+            timeout: Longest post-teleport wait in seconds
 
-        self.log.warning(f"Level 3 not found after {teleport_count} teleports")
-        return False
+        Returns:
+            True if the entrance was detected (and clicked)
+        """
+        self.combat.cast_teleport(target)
+
+        if not self._wait_for_frame_stable(timeout):
+            return False
+
+        return self._detect_level_3_entrance()
 
     def _detect_level_3_entrance(self) -> bool:
         """
@@ -301,18 +340,36 @@ class MephistoRun(BaseRun):
             # Use heuristic: after enough teleports, try clicking center
             return False
 
-        screen = self.capture.grab()
-        # Look for stairs/entrance template
-        match = self.matcher.find(screen, "objects/durance_stairs", threshold=0.7)
-        if match:
-            # Click on the stairs to enter
-            self.log.info(f"Level 3 stairs detected at {match.center}")
-            self.input.click(match.center[0], match.center[1])
-            time.sleep(0.5)
-            return True
+        templates = self._stairs_tmpls
+        if not templates:
+            templates = self._stairs_tmpls = self._load_stairs_templates()
+            if not templates:
+                return False
+
+        # One grayscale frame shared by every stairs/entrance template
+        screen = self.capture.grab_gray()
+        for template in templates:
+            match = self.matcher.find_cached(
+                screen, template, threshold=0.7, downscale=4, coarse_threshold=0.55
+            )
+            if match:
+                # Click on the stairs to enter
+                self.log.info(f"Level 3 stairs detected at {match.center}")
+                self.input.click(match.center[0], match.center[1])
+                time.sleep(0.5)
+                return True
 
         return False
 
+    def _load_stairs_templates(self) -> List[np.ndarray]:
+        """Load the grayscale Level 3 stairs templates that exist."""
+        templates = []
+        for name in self.STAIRS_TEMPLATES:
+            template = self.matcher.get_template_gray(name)
+            if template is not None:
+                templates.append(template)
+        return templates
+
     def _enter_level_3(self) -> bool:
         """
         Enter Durance of Hate Level 3.
@@ -354,7 +411,8 @@ class MephistoRun(BaseRun):
             if not self._check_health():
                 return False
             self.combat.cast_teleport(pos)
-            time.sleep(0.2)
+            if not self._wait_for_frame_stable(0.2):
+                return False
 
         # Now teleport to moat position
         for pos in self.MOAT_POSITIONS:
@@ -362,7 +420,8 @@ class MephistoRun(BaseRun):
                 return False
 
             self.combat.cast_teleport(pos)
-            time.sleep(0.3)
+            if not self._wait_for_frame_stable(0.3):
+                return False
 
             # Check if we're in a good position
             # (In real implementation, would verify position visually)
@@ -390,26 +449,31 @@ class MephistoRun(BaseRun):
 
         target = self.MEPHISTO_TARGET
 
+        # Bind per-cast calls once
+        cast_static = self.combat.cast_static_field
+        cast_bliz = self.combat.cast_blizzard
+        can_cast = self.combat.can_cast
+        check_health = self._check_health
+        settle_after = self._settle_after
+
         # Phase 1: Static Field spam (works across moat)
         for _ in range(self.static_casts):
-            if not self._check_health():
+            if not check_health():
                 return False
-            self.combat.cast_static_field()
-            time.sleep(self.cast_settle_time)
+            cast_static()
+            settle_after(Skill.STATIC_FIELD)
 
         # Phase 2: Blizzard spam with Static Field between casts
-        from src.game.combat import Skill
-
         for _ in range(self.blizzard_casts):
-            if not self._check_health():
+            if not check_health():
                 return False
-            self.combat.cast_blizzard(target)
-            time.sleep(self.cast_settle_time)
+            cast_bliz(target)
+            settle_after(Skill.BLIZZARD)
 
             # Cast Static Field between Blizzard cooldowns
-            if self.combat.can_cast(Skill.STATIC_FIELD):
-                self.combat.cast_static_field()
-                time.sleep(self.cast_settle_time)
+            if can_cast(Skill.STATIC_FIELD):
+                cast_static()
+                settle_after(Skill.STATIC_FIELD)
 
         # Wait for final Blizzard damage
         time.sleep(3.0)
@@ -445,25 +509,8 @@ class MephistoRun(BaseRun):
             return self.loot.pickup_all_valid()
 
         # Fallback: click around corpse area with show items
-        self.input.key_down("alt")
-        time.sleep(0.3)
-
-        items_picked = 0
-        loot_positions = [
-            self.MEPHISTO_TARGET,
-            (self.MEPHISTO_TARGET[0] - 50, self.MEPHISTO_TARGET[1]),
-            (self.MEPHISTO_TARGET[0] + 50, self.MEPHISTO_TARGET[1]),
-            (self.MEPHISTO_TARGET[0], self.MEPHISTO_TARGET[1] - 40),
-            (self.MEPHISTO_TARGET[0], self.MEPHISTO_TARGET[1] + 40),
-        ]
-
-        for pos in loot_positions:
-            self.input.click(pos[0], pos[1])
-            time.sleep(0.15)
-            items_picked += 1
-
-        self.input.key_up("alt")
-        return items_picked
+        self.input.click_batch(self.LOOT_SCAN_POSITIONS, interval=0.15, modifier="alt")
+        return len(self.LOOT_SCAN_POSITIONS)
 
     # ========== Configuration ==========
 
@@ -7,7 +7,7 @@ import numpy as np
 
 from src.data.models import Config
 from src.input.controller import InputController
-from src.game.combat import SorceressCombat
+from src.game.combat import SorceressCombat, Skill
 from src.game.health import HealthMonitor
 from src.game.town import TownManager, NPC
 from src.utils.logger import get_logger
@@ -38,17 +38,20 @@ class PindleRun(BaseRun):
     PORTAL_ENTER_OFFSET = (0, -50)  # Click slightly above center to enter portal
 
     # Pindleskin spawns north of portal - teleport direction
-    PINDLE_TELEPORT_POSITIONS = [
+    PINDLE_TELEPORT_POSITIONS = (
         (960, 300),   # North of center
         (960, 200),   # Further north
-    ]
+    )
+
+    # Pindleskin detection templates (tried in order)
+    PINDLE_TEMPLATES = ("monsters/pindle_name", "monsters/pindle_body")
 
     # After killing, expected Pindleskin corpse area
-    LOOT_SCAN_POSITIONS = [
+    LOOT_SCAN_POSITIONS = (
         (960, 250),
         (860, 250),
         (1060, 250),
-    ]
+    )
 
     def __init__(
         self,
@@ -139,13 +142,14 @@ class PindleRun(BaseRun):
         if not self._check_health():
             return RunResult(status=RunStatus.CHICKEN)
 
-        # Step 5: Teleport to Pindleskin
-        if self.teleport_to_pindle:
-            self._teleport_to_pindle()
+        with self._timer("combat"):
+            # Step 5: Teleport to Pindleskin
+            if self.teleport_to_pindle:
+                self._teleport_to_pindle()
 
-        # Step 6: Kill Pindleskin
-        if self._kill_pindleskin():
-            kills = 1
+            # Step 6: Kill Pindleskin
+            if self._kill_pindleskin():
+                kills = 1
 
         # Health check after combat
         if not self._check_health():
@@ -155,8 +159,9 @@ class PindleRun(BaseRun):
             )
 
         # Step 7: Loot
-        time.sleep(self.wait_for_loot)  # Wait for items to drop
-        items = self._loot_area()
+        with self._timer("loot"):
+            time.sleep(self.wait_for_loot)  # Wait for items to drop
+            items = self._loot_area()
 
         # Step 8: Exit game (save & exit for fast restart)
         self._exit_game()
@@ -258,19 +263,25 @@ class PindleRun(BaseRun):
         # Target area (Pindleskin spawns north of entry)
         target = (960, 250)
 
+        # Bind per-cast calls once
+        cast_static = self.combat.cast_static_field
+        cast_bliz = self.combat.cast_blizzard
+        check_health = self._check_health
+        settle_after = self._settle_after
+
         # Cast Static Field to reduce HP quickly
         for _ in range(self.static_casts):
-            if not self._check_health():
+            if not check_health():
                 return False
-            self.combat.cast_static_field()
-            time.sleep(self.cast_settle_time)
+            cast_static()
+            settle_after(Skill.STATIC_FIELD)
 
         # Cast Blizzard
         for _ in range(self.blizzard_casts):
-            if not self._check_health():
+            if not check_health():
                 return False
-            self.combat.cast_blizzard(target)
-            time.sleep(self.cast_settle_time)
+            cast_bliz(target)
+            settle_after(Skill.BLIZZARD)
 
         # Wait for Blizzard damage
         time.sleep(2.0)
@@ -295,18 +306,8 @@ class PindleRun(BaseRun):
             return self.loot.pickup_all_valid()
 
         # Fallback: click at known loot positions with show items
-        self.input.key_down("alt")
-        time.sleep(0.3)
-
-        items_picked = 0
-        for pos in self.LOOT_SCAN_POSITIONS:
-            self.input.click(pos[0], pos[1])
-            time.sleep(0.15)
-            items_picked += 1
-
-        self.input.key_up("alt")
-
-        return items_picked
+        self.input.click_batch(self.LOOT_SCAN_POSITIONS, interval=0.15, modifier="alt")
+        return len(self.LOOT_SCAN_POSITIONS)
 
     def find_pindleskin(self, screen: np.ndarray) -> Optional[Tuple[int, int]]:
         """
@@ -321,10 +322,14 @@ class PindleRun(BaseRun):
         if self.detector is None:
             return None
 
-        # Would use template matching or name detection
-        # Pindleskin has a unique name label
+        # Pindleskin has a unique name label; match it or his model
+        matcher = getattr(self, "matcher", None)
+        if matcher is not None:
+            found = matcher.find_any(screen, self.PINDLE_TEMPLATES, threshold=0.7)
+            if found:
+                return found[1].center
 
-        # For now, return expected position
+        # Fallback: expected spawn position
         return (960, 250)
 
     def set_static_casts(self, count: int) -> None:
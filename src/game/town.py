@@ -4,6 +4,8 @@ import time
 from enum import Enum, auto
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.data.models import Config
 from src.input.controller import InputController
 from src.utils.logger import get_logger
@@ -62,6 +64,23 @@ NPC_TEMPLATES = {
     # Other acts can be added as needed
 }
 
+# Healer and smith for each act's town
+HEALERS_BY_ACT = {
+    Act.ACT1: NPC.AKARA,
+    Act.ACT2: NPC.FARA,
+    Act.ACT3: NPC.ORMUS,
+    Act.ACT4: NPC.JAMELLA,
+    Act.ACT5: NPC.MALAH,
+}
+
+SMITHS_BY_ACT = {
+    Act.ACT1: NPC.CHARSI,
+    Act.ACT2: NPC.FARA,
+    Act.ACT3: NPC.HRATLI,
+    Act.ACT4: NPC.HALBU,
+    Act.ACT5: NPC.LARZUK,
+}
+
 # Template names for town objects
 OBJECT_TEMPLATES = {
     "stash": "hud/stash",
@@ -79,6 +98,13 @@ DIALOG_TEMPLATES = {
     "gamble": "dialog/gamble",
 }
 
+# Templates that confirm a panel opened after clicking
+PANEL_TEMPLATES = {
+    "dialog": "npcs/action_btn/npc_dialogue",
+    "stash": "hud/stash_open",
+    "waypoint": "hud/waypoint_menu",
+}
+
 # Screen positions for common actions (1920x1080)
 # These are fallback positions when templates aren't found
 SCREEN_POSITIONS = {
@@ -100,6 +126,12 @@ SCREEN_POSITIONS = {
     "act5_cain": (350, 200),
 }
 
+# SCREEN_POSITIONS keyed by (act number, name) for per-call lookups
+FALLBACK_POSITIONS = {
+    (int(key[3:key.index("_")]), key[key.index("_") + 1:]): pos
+    for key, pos in SCREEN_POSITIONS.items()
+}
+
 
 class TownManager:
     """
@@ -109,6 +141,9 @@ class TownManager:
     use stash, waypoints, and portals.
     """
 
+    # Pixels around an expected position searched before the full frame
+    SEARCH_RADIUS = 150
+
     def __init__(
         self,
         config: Optional[Config] = None,
@@ -139,17 +174,181 @@ class TownManager:
         self.interact_delay = 0.5
         self.dialog_timeout = 3.0
 
+        # Frame shared by template searches until the next input
+        self.frame_ttl = 0.15
+        self._frame: Optional[np.ndarray] = None
+        self._frame_time: float = 0.0
+
+        # Earliest monotonic time the next input or capture may happen
+        self._next_action: float = 0.0
+
+        # Where each template last matched (current act only)
+        self._last_seen: Dict[str, Tuple[int, int]] = {}
+
+        # Load every town template up front instead of on first search
+        if self.matcher is not None:
+            self.matcher.preload_templates([
+                *NPC_TEMPLATES.values(),
+                *OBJECT_TEMPLATES.values(),
+                *DIALOG_TEMPLATES.values(),
+                *PANEL_TEMPLATES.values(),
+            ])
+
     def set_act(self, act: Act) -> None:
         """Set current act for position lookups."""
         self.current_act = act
+        self._last_seen.clear()
         self.log.info(f"Set current act to {act.name}")
 
-    def find_object(self, name: str) -> Optional[Tuple[int, int]]:
+    def _grab_frame(self) -> np.ndarray:
+        """
+        Grab a screen frame, reusing the last one while it is still fresh.
+
+        Consecutive searches with no input in between see the same screen,
+        so they share one capture. Any input sent through this manager
+        invalidates the frame.
+        """
+        now = time.monotonic()
+        if self._frame is None or now - self._frame_time > self.frame_ttl:
+            self._ready()
+            self._frame = self.capture.grab()
+            self._frame_time = time.monotonic()
+        return self._frame
+
+    def invalidate_frame(self) -> None:
+        """Drop the shared frame so the next search captures a new one."""
+        self._frame = None
+
+    def _settle(self, delay: float) -> None:
+        """
+        Schedule a settle delay after an action without blocking.
+
+        The next input or screen grab waits out whatever is left of it,
+        so work done in between overlaps the delay instead of adding to it.
+        """
+        self._next_action = max(self._next_action, time.monotonic()) + delay
+
+    def _ready(self) -> None:
+        """Block until any pending settle delay has passed."""
+        remaining = self._next_action - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def _click(self, x: int, y: int) -> None:
+        """Click and invalidate the shared frame."""
+        self._ready()
+        self.input.click(x, y)
+        self._frame = None
+
+    def _press(self, key: str) -> None:
+        """Press a key and invalidate the shared frame."""
+        self._ready()
+        self.input.press(key)
+        self._frame = None
+
+    def _wait_for(
+        self,
+        panel: str,
+        timeout: Optional[float] = None,
+        interval: float = 0.03,
+        fallback_extra: float = 0.0,
+    ) -> bool:
+        """
+        Wait for a panel to appear on screen after a click.
+
+        Polls the screen and returns as soon as the panel template
+        matches. Without capture/matcher, or if the template is not
+        available, falls back to the fixed interact_delay.
+
+        Args:
+            panel: Panel name from PANEL_TEMPLATES
+            timeout: Max wait time (uses dialog_timeout if None)
+            interval: Seconds between polls
+            fallback_extra: Seconds added to the fixed fallback delay
+
+        Returns:
+            True if the panel was seen (or could not be checked)
+        """
+        template_name = PANEL_TEMPLATES[panel]
+        if (
+            self.capture is None
+            or self.matcher is None
+            or self.matcher.load_template(template_name) is None
+        ):
+            time.sleep(self.interact_delay + fallback_extra)
+            return True
+
+        self._ready()
+        deadline = time.monotonic() + (timeout or self.dialog_timeout)
+        while True:
+            screen = self.capture.grab()
+            now = time.monotonic()
+            if self.matcher.find(screen, template_name, threshold=0.8):
+                # Later searches on this screen can reuse the frame
+                self._frame = screen
+                self._frame_time = now
+                return True
+            if now >= deadline:
+                self.log.debug("Timed out waiting for {}", panel)
+                return False
+            time.sleep(interval)
+
+    def _locate(
+        self,
+        screen: np.ndarray,
+        template_name: str,
+        near: Optional[Tuple[int, int]] = None,
+        threshold: float = 0.75,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Match a template, searching around its expected position first.
+
+        The window of SEARCH_RADIUS pixels is centred on where the
+        template last matched, or else on the given approximate
+        position, and is searched before the full frame.
+
+        Args:
+            screen: Frame to search
+            template_name: Template to match
+            near: Expected (x, y) position, if known
+            threshold: Minimum confidence threshold
+
+        Returns:
+            (x, y) center of the match, or None if not found
+        """
+        near = self._last_seen.get(template_name, near)
+        pos = None
+
+        if near is not None and isinstance(screen, np.ndarray):
+            r = self.SEARCH_RADIUS
+            x0 = max(0, near[0] - r)
+            y0 = max(0, near[1] - r)
+            roi = screen[y0:near[1] + r, x0:near[0] + r]
+            match = self.matcher.find(roi, template_name, threshold=threshold)
+            if match:
+                cx, cy = match.center
+                pos = (cx + x0, cy + y0)
+
+        if pos is None:
+            match = self.matcher.find(screen, template_name, threshold=threshold)
+            if match is None:
+                return None
+            pos = match.center
+
+        self._last_seen[template_name] = pos
+        return pos
+
+    def find_object(
+        self,
+        name: str,
+        screen: Optional[np.ndarray] = None,
+    ) -> Optional[Tuple[int, int]]:
         """
         Find a town object on screen.
 
         Args:
             name: Object name (stash, waypoint, portal, etc.)
+            screen: Pre-grabbed frame (default: shared frame)
 
         Returns:
             (x, y) position or None if not found
@@ -162,35 +361,40 @@ class TownManager:
             self.log.warning(f"Unknown object: {name}")
             return None
 
-        screen = self.capture.grab()
-        match = self.matcher.find(screen, template_name, threshold=0.75)
+        fallback = FALLBACK_POSITIONS.get((self.current_act.value, name))
 
-        if match:
-            return match.center
+        if screen is None:
+            screen = self._grab_frame()
+        pos = self._locate(screen, template_name, near=fallback)
+
+        if pos:
+            return pos
 
         # Fallback to hardcoded position
-        fallback_key = f"act{self.current_act.value}_{name}"
-        fallback = SCREEN_POSITIONS.get(fallback_key)
         if fallback:
-            self.log.debug(f"Using fallback position for {name}: {fallback}")
+            self.log.debug("Using fallback position for {}: {}", name, fallback)
             return fallback
 
         return None
 
-    def find_npc(self, npc: NPC) -> Optional[Tuple[int, int]]:
+    def find_npc(
+        self,
+        npc: NPC,
+        screen: Optional[np.ndarray] = None,
+    ) -> Optional[Tuple[int, int]]:
         """
         Find an NPC on screen.
 
         Args:
             npc: NPC to find
+            screen: Pre-grabbed frame (default: shared frame)
 
         Returns:
             (x, y) position or None if not found
         """
         if self.capture is None or self.matcher is None:
             # Use fallback position
-            fallback_key = f"act{self.current_act.value}_{npc.value}"
-            fallback = SCREEN_POSITIONS.get(fallback_key)
+            fallback = FALLBACK_POSITIONS.get((self.current_act.value, npc.value))
             if fallback:
                 return fallback
             return None
@@ -200,15 +404,17 @@ class TownManager:
             self.log.warning(f"No template for NPC: {npc.value}")
             return None
 
-        screen = self.capture.grab()
-        match = self.matcher.find(screen, template_name, threshold=0.75)
+        fallback = FALLBACK_POSITIONS.get((self.current_act.value, npc.value))
 
-        if match:
-            return match.center
+        if screen is None:
+            screen = self._grab_frame()
+        pos = self._locate(screen, template_name, near=fallback)
+
+        if pos:
+            return pos
 
         # Try fallback
-        fallback_key = f"act{self.current_act.value}_{npc.value}"
-        return SCREEN_POSITIONS.get(fallback_key)
+        return fallback
 
     def move_to(self, x: int, y: int) -> bool:
         """
@@ -221,9 +427,9 @@ class TownManager:
         Returns:
             True if movement initiated
         """
-        self.log.debug(f"Moving to ({x}, {y})")
-        self.input.click(x, y)
-        time.sleep(0.3)  # Wait for movement to start
+        self.log.debug("Moving to ({}, {})", x, y)
+        self._click(x, y)
+        self._settle(0.3)  # Wait for movement to start
         return True
 
     def teleport_to(self, x: int, y: int) -> bool:
@@ -238,9 +444,11 @@ class TownManager:
             True if teleport initiated
         """
         # Assuming teleport is on right-click
-        self.log.debug(f"Teleporting to ({x}, {y})")
+        self.log.debug("Teleporting to ({}, {})", x, y)
+        self._ready()
         self.input.right_click(x, y)
-        time.sleep(0.2)
+        self._frame = None
+        self._settle(0.2)
         return True
 
     def go_to_npc(self, npc: NPC, use_teleport: bool = True) -> bool:
@@ -267,7 +475,7 @@ class TownManager:
             self.move_to(pos[0], pos[1])
 
         # Wait for movement
-        time.sleep(0.5)
+        self._settle(0.5)
         return True
 
     def interact_with_npc(self, npc: NPC) -> bool:
@@ -288,11 +496,45 @@ class TownManager:
             return False
 
         # Click on NPC to interact
-        self.input.click(pos[0], pos[1])
-        time.sleep(self.interact_delay)
+        self._click(pos[0], pos[1])
+        return self._wait_for("dialog")
 
-        # TODO: Verify dialog opened via template matching
-        return True
+    def find_dialog_option(
+        self,
+        options: List[str],
+    ) -> Optional[Tuple[str, Tuple[int, int]]]:
+        """
+        Find whichever of several dialog options is on screen.
+
+        All option templates are searched in one pass over a single
+        grayscale conversion of the frame.
+
+        Args:
+            options: Dialog options to look for, in priority order
+
+        Returns:
+            (option, (x, y)) for the first option found, or None
+        """
+        if self.capture is None or self.matcher is None:
+            return None
+
+        names = {}
+        for option in options:
+            template_name = DIALOG_TEMPLATES.get(option)
+            if template_name:
+                names[template_name] = option
+            else:
+                self.log.warning(f"Unknown dialog option: {option}")
+
+        if not names:
+            return None
+
+        found = self.matcher.find_any(self._grab_frame(), list(names), threshold=0.8)
+        if found is None:
+            return None
+
+        template_name, match = found
+        return names[template_name], match.center
 
     def click_dialog_option(self, option: str) -> bool:
         """
@@ -313,13 +555,13 @@ class TownManager:
             self.log.warning(f"Unknown dialog option: {option}")
             return False
 
-        screen = self.capture.grab()
+        screen = self._grab_frame()
         match = self.matcher.find(screen, template_name, threshold=0.8)
 
         if match:
             self.log.info(f"Clicking dialog option: {option}")
-            self.input.click(match.center[0], match.center[1])
-            time.sleep(self.interact_delay)
+            self._click(match.center[0], match.center[1])
+            self._settle(self.interact_delay)
             return True
 
         return False
@@ -338,15 +580,13 @@ class TownManager:
             self.log.warning("Could not find stash")
             return False
 
-        self.input.click(pos[0], pos[1])
-        time.sleep(self.interact_delay)
-
-        # TODO: Verify stash is open
-        return True
+        self._click(pos[0], pos[1])
+        # Without a stash template, also give the stash grid time to load
+        return self._wait_for("stash", fallback_extra=0.5)
 
     def close_stash(self) -> None:
         """Close stash (press Escape)."""
-        self.input.press("escape")
+        self._press("escape")
         time.sleep(0.3)
 
     def use_waypoint(self, destination: str = None) -> bool:
@@ -366,8 +606,10 @@ class TownManager:
             self.log.warning("Could not find waypoint")
             return False
 
-        self.input.click(pos[0], pos[1])
-        time.sleep(self.interact_delay)
+        self._click(pos[0], pos[1])
+        if not self._wait_for("waypoint"):
+            self.log.warning("Waypoint menu did not open")
+            return False
 
         # If destination specified, would need to click it
         # For now, just opens the waypoint menu
@@ -377,7 +619,7 @@ class TownManager:
 
     def close_waypoint(self) -> None:
         """Close waypoint menu."""
-        self.input.press("escape")
+        self._press("escape")
         time.sleep(0.3)
 
     def go_to_red_portal(self) -> bool:
@@ -391,7 +633,7 @@ class TownManager:
 
         pos = self.find_object("red_portal")
         if pos is None:
-            # Try finding Anya and moving near her
+            # Try finding Anya and moving near her (reuses the same frame)
             anya_pos = self.find_npc(NPC.ANYA)
             if anya_pos:
                 # Red portal is near Anya
@@ -401,7 +643,7 @@ class TownManager:
 
         if pos:
             self.teleport_to(pos[0], pos[1])
-            time.sleep(0.3)
+            self._settle(0.3)
             return True
 
         return False
@@ -421,7 +663,7 @@ class TownManager:
 
         if pos:
             # Click to enter
-            self.input.click(pos[0], pos[1])
+            self._click(pos[0], pos[1])
             time.sleep(1.0)  # Wait for loading
             return True
 
@@ -458,14 +700,7 @@ class TownManager:
         Returns:
             True if reached healer
         """
-        healers = {
-            Act.ACT1: NPC.AKARA,
-            Act.ACT2: NPC.FARA,
-            Act.ACT3: NPC.ORMUS,
-            Act.ACT4: NPC.JAMELLA,
-            Act.ACT5: NPC.MALAH,
-        }
-        healer = healers.get(self.current_act, NPC.MALAH)
+        healer = HEALERS_BY_ACT.get(self.current_act, NPC.MALAH)
         return self.go_to_npc(healer)
 
     def heal(self) -> bool:
@@ -478,14 +713,7 @@ class TownManager:
         if not self.go_to_healer():
             return False
 
-        healers = {
-            Act.ACT1: NPC.AKARA,
-            Act.ACT2: NPC.FARA,
-            Act.ACT3: NPC.ORMUS,
-            Act.ACT4: NPC.JAMELLA,
-            Act.ACT5: NPC.MALAH,
-        }
-        healer = healers.get(self.current_act, NPC.MALAH)
+        healer = HEALERS_BY_ACT.get(self.current_act, NPC.MALAH)
 
         if not self.interact_with_npc(healer):
             return False
@@ -499,14 +727,7 @@ class TownManager:
         Returns:
             True if reached smith
         """
-        smiths = {
-            Act.ACT1: NPC.CHARSI,
-            Act.ACT2: NPC.FARA,
-            Act.ACT3: NPC.HRATLI,
-            Act.ACT4: NPC.HALBU,
-            Act.ACT5: NPC.LARZUK,
-        }
-        smith = smiths.get(self.current_act, NPC.LARZUK)
+        smith = SMITHS_BY_ACT.get(self.current_act, NPC.LARZUK)
         return self.go_to_npc(smith)
 
     def repair_items(self) -> bool:
@@ -516,14 +737,7 @@ class TownManager:
         Returns:
             True if repair initiated
         """
-        smiths = {
-            Act.ACT1: NPC.CHARSI,
-            Act.ACT2: NPC.FARA,
-            Act.ACT3: NPC.HRATLI,
-            Act.ACT4: NPC.HALBU,
-            Act.ACT5: NPC.LARZUK,
-        }
-        smith = smiths.get(self.current_act, NPC.LARZUK)
+        smith = SMITHS_BY_ACT.get(self.current_act, NPC.LARZUK)
 
         if not self.go_to_npc(smith):
             return False
@@ -539,7 +753,7 @@ class TownManager:
 
     def close_dialog(self) -> None:
         """Close any open NPC dialog."""
-        self.input.press("escape")
+        self._press("escape")
         time.sleep(0.3)
 
     def town_routine(self, inventory_manager=None) -> bool:
@@ -558,25 +772,25 @@ class TownManager:
 
         # 1. Heal
         if self.go_to_healer():
-            self.interact_with_npc(NPC.MALAH)
-            self.click_dialog_option("heal")
+            if self.interact_with_npc(HEALERS_BY_ACT.get(self.current_act, NPC.MALAH)):
+                self.click_dialog_option("heal")
             self.close_dialog()
 
         # 2. Repair (if needed - would check durability)
         # self.repair_items()
         # self.close_dialog()
 
-        # 3. Identify items
+        # 3. Identify items (already at Cain, so don't walk there twice)
         if self.go_to_cain():
-            self.identify_items()
+            if self.interact_with_npc(NPC.CAIN):
+                self.click_dialog_option("identify")
             self.close_dialog()
 
         # 4. Stash items
         if self.open_stash():
-            time.sleep(0.5)
-            if inventory_manager:
-                inventory_manager.stash_all_items()
-            time.sleep(0.3)
+            # Only pause for the last transfer to land if anything moved
+            if inventory_manager and inventory_manager.stash_all_items():
+                time.sleep(0.3)
             self.close_stash()
 
         self.log.info("Town routine complete")
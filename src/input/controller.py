@@ -2,7 +2,8 @@
 
 import random
 import time
-from typing import Optional, Tuple
+from functools import partial
+from typing import Any, Iterable, Optional, Sequence, Tuple
 
 from src.input.mouse import MouseMover
 from src.input.keyboard import KeyboardController
@@ -90,13 +91,15 @@ class InputController:
             self._backend = "pydirectinput"
 
             # Set mouse functions
-            self.mouse.set_move_function(pydirectinput.moveTo)
+            self._move = pydirectinput.moveTo
+            self.mouse.set_move_function(self._move)
 
             # Set keyboard functions
             self.keyboard.set_key_functions(
                 key_down=pydirectinput.keyDown,
                 key_up=pydirectinput.keyUp,
                 press=pydirectinput.press,
+                type_str=pydirectinput.typewrite,
             )
 
             # Store click functions
@@ -109,12 +112,15 @@ class InputController:
             self.log.info("Using pyautogui backend (fallback)")
             self._backend = "pyautogui"
 
-            self.mouse.set_move_function(lambda x, y: pyautogui.moveTo(x, y, _pause=False))
+            # partial binds _pause once; called for every step of a human-like move
+            self._move = partial(pyautogui.moveTo, _pause=False)
+            self.mouse.set_move_function(self._move)
 
             self.keyboard.set_key_functions(
                 key_down=pyautogui.keyDown,
                 key_up=pyautogui.keyUp,
                 press=pyautogui.press,
+                type_str=pyautogui.typewrite,
             )
 
             self._click = pyautogui.click
@@ -125,6 +131,7 @@ class InputController:
         else:
             self.log.warning("No input backend available - input disabled")
             self._backend = None
+            self._move = None
             self._click = None
             self._mouse_down = None
             self._mouse_up = None
@@ -154,10 +161,8 @@ class InputController:
         """
         if self.human_like:
             self.mouse.move_to(x, y)
-        elif self._backend == "pydirectinput":
-            pydirectinput.moveTo(x, y)
-        elif self._backend == "pyautogui":
-            pyautogui.moveTo(x, y, _pause=False)
+        elif self._move:
+            self._move(x, y)
 
     def click(self, x: Optional[int] = None, y: Optional[int] = None, button: str = "left") -> None:
         """
@@ -169,6 +174,10 @@ class InputController:
             button: 'left', 'right', or 'middle'
         """
         if x is not None and y is not None:
+            if not self.human_like and self._click:
+                # Backend click moves and clicks in one call
+                self._click(x=x, y=y, button=button)
+                return
             self.move_to(x, y)
             self._random_delay((0.02, 0.05))
 
@@ -184,6 +193,11 @@ class InputController:
 
     def double_click(self, x: Optional[int] = None, y: Optional[int] = None) -> None:
         """Double-click at position."""
+        if not self.human_like and self._click:
+            # Backend moves and issues both clicks in one call
+            self._click(x=x, y=y, clicks=2, interval=random.uniform(0.05, 0.1), button="left")
+            return
+
         self.click(x, y)
         self._random_delay((0.05, 0.1))
         self.click(button="left")
@@ -240,13 +254,78 @@ class InputController:
         self.keyboard.key_up(key)
 
     def type_text(self, text: str) -> None:
-        """Type text with human-like delays."""
-        self.keyboard.type_text(text)
+        """Type text (with human-like delays if enabled)."""
+        self.keyboard.type_text(text, human_like=self.human_like)
 
     def press_combo(self, *keys: str) -> None:
         """Press key combination."""
         self.keyboard.press_combo(*keys)
 
+    def send_sequence(self, steps: Sequence[Tuple[str, Any, float]]) -> None:
+        """
+        Send a scripted sequence of input actions in one call.
+
+        The backends expose no batched event API, so steps are dispatched
+        back-to-back here; callers still hand over the whole sequence at
+        once instead of interleaving their own input calls and sleeps.
+
+        Args:
+            steps: (action, arg, delay) tuples. action is 'press',
+                'key_down' or 'key_up' (arg = key), 'click' or 'move'
+                (arg = (x, y), or None to click in place). delay is
+                seconds to wait after the action.
+
+        Raises:
+            ValueError: If a step uses an unknown action
+        """
+        for action, arg, delay in steps:
+            if action == "press":
+                self.keyboard.press(arg)
+            elif action == "click":
+                if arg is None:
+                    self.click()
+                else:
+                    self.click(arg[0], arg[1])
+            elif action == "move":
+                self.move_to(arg[0], arg[1])
+            elif action == "key_down":
+                self.keyboard.key_down(arg)
+            elif action == "key_up":
+                self.keyboard.key_up(arg)
+            else:
+                raise ValueError(f"Unknown input action: {action}")
+
+            if delay > 0:
+                time.sleep(delay)
+
+    def click_batch(
+        self,
+        positions: Iterable[Tuple[int, int]],
+        interval: float = 0.15,
+        modifier: Optional[str] = None,
+        modifier_delay: float = 0.3,
+    ) -> None:
+        """
+        Click a series of positions, optionally while holding a key.
+
+        Args:
+            positions: (x, y) positions to click in order
+            interval: Seconds to wait after each click
+            modifier: Key held for the whole batch (e.g. 'alt')
+            modifier_delay: Seconds to wait after pressing the modifier
+        """
+        steps = [("click", pos, interval) for pos in positions]
+        if modifier is None:
+            self.send_sequence(steps)
+            return
+
+        self.keyboard.key_down(modifier)
+        try:
+            time.sleep(modifier_delay)
+            self.send_sequence(steps)
+        finally:
+            self.keyboard.key_up(modifier)
+
     # ========== Game-Specific Methods ==========
 
     def cast_skill(self, skill_key: str, target: Optional[Tuple[int, int]] = None) -> None:
@@ -38,17 +38,29 @@ class KeyboardController:
         self._key_down_func: Optional[Callable[[str], None]] = None
         self._key_up_func: Optional[Callable[[str], None]] = None
         self._press_func: Optional[Callable[[str], None]] = None
+        self._type_func: Optional[Callable[[str], None]] = None
+
+        # Missing-backend warnings already logged (each is logged once)
+        self._warned: set[str] = set()
 
     def set_key_functions(
         self,
         key_down: Callable[[str], None],
         key_up: Callable[[str], None],
         press: Optional[Callable[[str], None]] = None,
+        type_str: Optional[Callable[[str], None]] = None,
     ) -> None:
         """Set low-level keyboard functions."""
         self._key_down_func = key_down
         self._key_up_func = key_up
         self._press_func = press
+        self._type_func = type_str
+
+    def _warn_missing(self, message: str) -> None:
+        """Log a missing-backend warning the first time it occurs."""
+        if message not in self._warned:
+            self._warned.add(message)
+            self.log.warning(message)
 
     def _vary(self, value: float) -> float:
         """Add random variation to a value."""
@@ -77,7 +89,17 @@ class KeyboardController:
             self._random_delay(self.hold_duration)
             self._key_up_func(key)
         else:
-            self.log.warning("No keyboard functions set")
+            self._warn_missing("No keyboard functions set")
+
+    def _press_fast(self, key: str) -> None:
+        """Press and release a key with no added delays."""
+        if self._press_func:
+            self._press_func(key)
+        elif self._key_down_func and self._key_up_func:
+            self._key_down_func(key)
+            self._key_up_func(key)
+        else:
+            self._warn_missing("No keyboard functions set")
 
     def hold(self, key: str, duration: float) -> None:
         """
@@ -88,7 +110,7 @@ class KeyboardController:
             duration: Hold duration in seconds
         """
         if not self._key_down_func or not self._key_up_func:
-            self.log.warning("No keyboard functions set")
+            self._warn_missing("No keyboard functions set")
             return
 
         self._key_down_func(key)
@@ -100,23 +122,38 @@ class KeyboardController:
         if self._key_down_func:
             self._key_down_func(key)
         else:
-            self.log.warning("No key_down function set")
+            self._warn_missing("No key_down function set")
 
     def key_up(self, key: str) -> None:
         """Release a held key."""
         if self._key_up_func:
             self._key_up_func(key)
         else:
-            self.log.warning("No key_up function set")
+            self._warn_missing("No key_up function set")
 
-    def type_text(self, text: str, char_delay: tuple[float, float] = (0.02, 0.08)) -> None:
+    def type_text(
+        self,
+        text: str,
+        char_delay: tuple[float, float] = (0.02, 0.08),
+        human_like: bool = True,
+    ) -> None:
         """
         Type text with human-like character delays.
 
         Args:
             text: Text to type
             char_delay: (min, max) delay between characters
+            human_like: If False, type with no delays at all
         """
+        if not human_like:
+            if self._type_func:
+                # Backend writes the whole string in one call
+                self._type_func(text)
+                return
+            for char in text:
+                self._press_fast(char)
+            return
+
         for char in text:
             self.press(char)
             self._random_delay(char_delay)
@@ -130,13 +167,16 @@ class KeyboardController:
             hold_time: How long to hold the combo
         """
         if not self._key_down_func or not self._key_up_func:
-            self.log.warning("No keyboard functions set")
+            self._warn_missing("No keyboard functions set")
             return
 
+        # One settle sleep per phase, as long as the per-key gaps combined
+        n = len(keys)
+
         # Press all keys down
         for key in keys:
             self._key_down_func(key)
-            time.sleep(random.uniform(0.01, 0.03))
+        time.sleep(random.uniform(n * 0.01, n * 0.03))
 
         # Hold
         time.sleep(self._vary(hold_time))
@@ -144,4 +184,4 @@ class KeyboardController:
         # Release in reverse order
         for key in reversed(keys):
             self._key_up_func(key)
-            time.sleep(random.uniform(0.01, 0.03))
+        time.sleep(random.uniform(n * 0.01, n * 0.03))
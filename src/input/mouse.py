@@ -1,12 +1,65 @@
 """Human-like mouse movement using WindMouse algorithm."""
 
+import atexit
 import math
 import random
+import sys
 import time
 from typing import Callable, Optional, Tuple
 
 from src.utils.logger import get_logger
 
+# WindMouse damping constants, hoisted out of the step loop
+_SQRT3 = math.sqrt(3)
+_SQRT5 = math.sqrt(5)
+_INV_SQRT3 = 1.0 / _SQRT3
+_WIND_SCALE = 1.0 / _SQRT5
+
+# Moves shorter than this (px) jump straight to the destination
+_SNAP_DISTANCE = 3.0
+
+# Final stretch of each step delay that is spun rather than slept (s)
+_SPIN_TAIL = 0.0005
+
+# Set once the 1ms Windows timer resolution has been requested
+_timer_period_set = False
+
+
+def _request_timer_resolution() -> None:
+    """
+    Ask Windows for 1ms timer resolution, released again at exit.
+
+    Before Python 3.11, time.sleep() on Windows rounds to the default
+    15.6ms timer tick; 3.11+ uses high-resolution timers and needs no help.
+    """
+    global _timer_period_set
+    if _timer_period_set or sys.platform != "win32" or sys.version_info >= (3, 11):
+        return
+    _timer_period_set = True
+
+    try:
+        import ctypes
+        winmm = ctypes.WinDLL("winmm")
+        if winmm.timeBeginPeriod(1) == 0:
+            atexit.register(winmm.timeEndPeriod, 1)
+    except (ImportError, OSError, AttributeError):
+        pass
+
+
+def _precise_sleep(duration: float) -> None:
+    """
+    Sleep for duration with sub-millisecond accuracy.
+
+    Sleeps through most of the delay, then spins on perf_counter for
+    the last _SPIN_TAIL seconds so scheduler jitter doesn't stretch
+    per-step mouse delays.
+    """
+    end = time.perf_counter() + duration
+    if duration > _SPIN_TAIL:
+        time.sleep(duration - _SPIN_TAIL)
+    while time.perf_counter() < end:
+        pass
+
 
 def wind_mouse(
     start_x: float,
@@ -19,6 +72,8 @@ def wind_mouse(
     target_area: float = 12.0,
     move_callback: Optional[Callable[[int, int], None]] = None,
     sleep_time: Tuple[float, float] = (0.001, 0.003),
+    rng: Optional[random.Random] = None,
+    coalesce_steps: int = 4,
 ) -> None:
     """
     Generate human-like mouse movement using the WindMouse algorithm.
@@ -38,9 +93,22 @@ def wind_mouse(
         target_area: Distance threshold for behavior change (D_0)
         move_callback: Function called for each movement step (x, y)
         sleep_time: (min, max) sleep duration between steps
+        rng: Random source (defaults to the module-level generator)
+        coalesce_steps: Steps merged into one move while outside target_area
     """
-    sqrt3 = math.sqrt(3)
-    sqrt5 = math.sqrt(5)
+    # Tiny moves need no path simulation
+    if math.hypot(dest_x - start_x, dest_y - start_y) < _SNAP_DISTANCE:
+        if move_callback:
+            move_callback(int(dest_x), int(dest_y))
+        return
+
+    rand = (rng or random).random
+    uniform = (rng or random).uniform
+    sleep = _precise_sleep
+    hypot = math.hypot
+
+    wind_scale = wind * _WIND_SCALE
+    max_v_half = max_velocity * 0.5
 
     current_x = float(start_x)
     current_y = float(start_y)
@@ -49,12 +117,17 @@ def wind_mouse(
     wind_x = 0.0
     wind_y = 0.0
 
+    # Last pixel actually sent; sub-pixel steps are not emitted
+    last_x = None
+    last_y = None
+    steps = 0  # Steps since the last emitted move
+
     max_iterations = 10000  # Prevent infinite loops
     iterations = 0
 
     while iterations < max_iterations:
         iterations += 1
-        distance = math.hypot(dest_x - current_x, dest_y - current_y)
+        distance = hypot(dest_x - current_x, dest_y - current_y)
 
         if distance < 1:
             break
@@ -62,12 +135,17 @@ def wind_mouse(
         # Wind force changes based on distance to target
         if distance >= target_area:
             # Far from target: wind adds random fluctuation
-            wind_x = wind_x / sqrt3 + (2 * random.random() - 1) * wind / sqrt5
-            wind_y = wind_y / sqrt3 + (2 * random.random() - 1) * wind / sqrt5
+            wind_x = wind_x * _INV_SQRT3 + (2 * rand() - 1) * wind_scale
+            wind_y = wind_y * _INV_SQRT3 + (2 * rand() - 1) * wind_scale
         else:
-            # Near target: wind dampens for precision
-            wind_x /= sqrt3
-            wind_y /= sqrt3
+            # Near target: wind dampens and speed drops for precision
+            wind_x *= _INV_SQRT3
+            wind_y *= _INV_SQRT3
+            if max_velocity < 3:
+                max_velocity = rand() * 3 + 3
+            else:
+                max_velocity *= _WIND_SCALE
+            max_v_half = max_velocity * 0.5
 
         # Gravity pulls toward destination
         gravity_x = gravity * (dest_x - current_x) / distance
@@ -78,9 +156,9 @@ def wind_mouse(
         velocity_y += wind_y + gravity_y
 
         # Limit velocity
-        velocity_mag = math.hypot(velocity_x, velocity_y)
+        velocity_mag = hypot(velocity_x, velocity_y)
         if velocity_mag > max_velocity:
-            velocity_clamp = max_velocity / 2 + random.random() * max_velocity / 2
+            velocity_clamp = max_v_half + rand() * max_v_half
             velocity_x = velocity_x / velocity_mag * velocity_clamp
             velocity_y = velocity_y / velocity_mag * velocity_clamp
 
@@ -88,16 +166,30 @@ def wind_mouse(
         current_x += velocity_x
         current_y += velocity_y
 
-        # Execute move
+        # Far from target, merge several steps into one move and sleep
+        steps += 1
+        if distance >= target_area and steps < coalesce_steps:
+            continue
+
+        # Execute move only when the cursor lands on a new pixel
+        move_x = round(current_x)
+        move_y = round(current_y)
+        if move_x == last_x and move_y == last_y:
+            steps = 0
+            continue
+        last_x = move_x
+        last_y = move_y
+
         if move_callback:
-            move_callback(int(round(current_x)), int(round(current_y)))
+            move_callback(move_x, move_y)
 
-        # Small delay for natural speed
+        # Small delay for natural speed, covering every merged step
         if sleep_time:
-            time.sleep(random.uniform(sleep_time[0], sleep_time[1]))
+            sleep(uniform(steps * sleep_time[0], steps * sleep_time[1]))
+        steps = 0
 
     # Final move to exact destination
-    if move_callback:
+    if move_callback and (int(dest_x), int(dest_y)) != (last_x, last_y):
         move_callback(int(dest_x), int(dest_y))
 
 
@@ -117,11 +209,13 @@ def generate_path(
         dest_x: Destination X position
         dest_y: Destination Y position
         **kwargs: Additional arguments passed to wind_mouse
+            (coalesce_steps defaults to 1 so every step is returned)
 
     Returns:
         List of (x, y) positions along the path
     """
     path = []
+    kwargs.setdefault("coalesce_steps", 1)  # Full-resolution path by default
 
     def collect_point(x: int, y: int) -> None:
         path.append((x, y))
@@ -170,12 +264,19 @@ class MouseMover:
         self.move_delay = move_delay
         self.log = get_logger()
 
+        # Dedicated random source for path jitter
+        self._rng = random.Random()
+
         # Position tracking
         self._current_x = 0
         self._current_y = 0
 
         # Movement backend (set by controller)
         self._move_func: Optional[Callable[[int, int], None]] = None
+        self._warned_missing = False
+
+        # Per-step delays are a few ms; coarse Windows sleeps would stretch them
+        _request_timer_resolution()
 
     def set_move_function(self, func: Callable[[int, int], None]) -> None:
         """Set the low-level move function."""
@@ -199,13 +300,13 @@ class MouseMover:
             y: Target Y position
         """
         if self._move_func is None:
-            self.log.warning("No move function set, cannot move mouse")
+            if not self._warned_missing:
+                self._warned_missing = True
+                self.log.warning("No move function set, cannot move mouse")
             return
 
-        def do_move(mx: int, my: int) -> None:
-            self._move_func(mx, my)
-            self._current_x = mx
-            self._current_y = my
+        if (int(x), int(y)) == (self._current_x, self._current_y):
+            return
 
         wind_mouse(
             self._current_x,
@@ -216,10 +317,15 @@ class MouseMover:
             wind=self.wind,
             max_velocity=self.max_velocity,
             target_area=self.target_area,
-            move_callback=do_move,
+            move_callback=self._move_func,
             sleep_time=self.move_delay,
+            rng=self._rng,
         )
 
+        # The path always ends with a move to the exact target
+        self._current_x = int(x)
+        self._current_y = int(y)
+
     def move_relative(self, dx: int, dy: int) -> None:
         """Move relative to current position."""
         self.move_to(self._current_x + dx, self._current_y + dy)
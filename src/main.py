@@ -3,33 +3,39 @@
 import signal
 import sys
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 import click
 
 from src.data.config import ConfigManager
 from src.data.statistics import StatisticsTracker
-from src.game.combat import SorceressCombat
-from src.game.health import HealthMonitor
-from src.game.leveling import LevelManager
-from src.game.loot import LootManager
-from src.game.menu import MenuNavigator
-from src.game.runs.base import RunStatus
-from src.game.runs.leveling import LevelingManager
-from src.game.runs.mephisto import MephistoRun
-from src.game.runs.pindle import PindleRun
-from src.game.town import TownManager
-from src.input.controller import InputController
 from src.utils.error_handler import ErrorHandler
 from src.utils.logger import get_logger, setup_logger
-from src.vision.game_detector import GameStateDetector
-from src.vision.screen_capture import ScreenCapture
-from src.vision.template_matcher import TemplateMatcher
+
+# Game, input and vision modules pull in OpenCV/NumPy/mss and the input
+# backends; they are imported only when the bot actually runs so that
+# `stats`, `status` and `version` start quickly.
+if TYPE_CHECKING:
+    from src.game.combat import SorceressCombat
+    from src.game.health import HealthMonitor
+    from src.game.leveling import LevelManager
+    from src.game.loot import LootManager
+    from src.game.menu import MenuNavigator
+    from src.game.town import TownManager
+    from src.input.controller import InputController
+    from src.vision.game_detector import GameStateDetector
+    from src.vision.screen_capture import ScreenCapture
+    from src.vision.template_matcher import TemplateMatcher
 
 
 class BotRunner:
     """Main bot runner that orchestrates all components."""
 
+    # Cap on the pause after consecutive failed runs (seconds)
+    MAX_BACKOFF = 30.0
+    # Runs longer than this already paced the loop, so no pause follows them
+    NATURAL_PACING = 30.0
+
     def __init__(self, run_type: str, run_count: int, config_manager: ConfigManager):
         self.run_type = run_type
         self.run_count = run_count
@@ -38,6 +44,10 @@ class BotRunner:
         self.log = get_logger()
         self.running = False
         self.runs_completed = 0
+        # Consecutive failures per run status, cleared by a successful run
+        self._failure_streaks: Dict[str, int] = {}
+        # Unhandled exceptions in a row, cleared by any run that returns
+        self._consecutive_exceptions = 0
 
         # Core components
         self.capture: Optional[ScreenCapture] = None
@@ -58,6 +68,17 @@ class BotRunner:
 
     def initialize(self):
         """Initialize all bot components."""
+        from src.game.combat import SorceressCombat
+        from src.game.health import HealthMonitor
+        from src.game.leveling import LevelManager
+        from src.game.loot import LootManager
+        from src.game.menu import MenuNavigator
+        from src.game.town import TownManager
+        from src.input.controller import InputController
+        from src.vision.game_detector import GameStateDetector
+        from src.vision.screen_capture import ScreenCapture
+        from src.vision.template_matcher import TemplateMatcher
+
         self.log.info("Initializing bot components...")
 
         # Vision system
@@ -157,6 +178,10 @@ class BotRunner:
 
     def _initialize_run_executor(self):
         """Initialize the appropriate run executor based on run type."""
+        from src.game.runs.leveling import LevelingManager
+        from src.game.runs.mephisto import MephistoRun
+        from src.game.runs.pindle import PindleRun
+
         common_args = {
             "config": self.config,
             "input_ctrl": self.input_ctrl,
@@ -186,9 +211,14 @@ class BotRunner:
 
     def start(self):
         """Start the bot main loop."""
+        from src.game.runs.base import RunStatus
+
         self.running = True
         self.runs_completed = 0
 
+        # Stream frames in the background when supported
+        self.capture.start_stream()
+
         # Start health monitoring
         self.health_monitor.start_monitoring()
 
@@ -215,6 +245,7 @@ class BotRunner:
 
                 try:
                     result = self.run_executor.execute()
+                    self._consecutive_exceptions = 0
 
                     # Log result
                     status_str = result.status.name
@@ -233,23 +264,27 @@ class BotRunner:
                     # Handle different results
                     if result.status == RunStatus.SUCCESS:
                         self.runs_completed += 1
+                        self._failure_streaks.clear()
                     elif result.status == RunStatus.CHICKEN:
                         self.log.warning("Chicken triggered! Starting new run...")
                         self.runs_completed += 1
-                        time.sleep(2)  # Brief pause before restarting
+                        # Brief pause before restarting
+                        self._backoff("CHICKEN", 2, result.run_time)
                     elif result.status == RunStatus.DEATH:
                         self.log.error("Character died! Starting new run...")
                         self.runs_completed += 1
-                        time.sleep(3)  # Longer pause after death
+                        # Longer pause after death
+                        self._backoff("DEATH", 3, result.run_time)
                     elif result.status == RunStatus.ERROR:
                         self.log.error(f"Run failed: {result.error_message}")
                         # Still count as a run attempt
                         self.runs_completed += 1
-                        time.sleep(5)  # Pause to avoid rapid errors
+                        # Pause to avoid rapid errors
+                        self._backoff("ERROR", 5, result.run_time)
                     elif result.status == RunStatus.TIMEOUT:
                         self.log.warning("Run timed out! Starting new run...")
                         self.runs_completed += 1
-                        time.sleep(3)
+                        self._backoff("TIMEOUT", 3, result.run_time)
 
                     # Print session stats every 10 runs
                     if self.runs_completed % 10 == 0:
@@ -258,8 +293,13 @@ class BotRunner:
                 except KeyboardInterrupt:
                     raise  # Re-raise to be caught by outer handler
                 except Exception as e:
-                    self.log.error(f"Unhandled error during run: {e}", exc_info=True)
-                    time.sleep(5)
+                    # Full traceback only for the first exception in a streak
+                    self._consecutive_exceptions += 1
+                    if self._consecutive_exceptions == 1:
+                        self.log.opt(exception=e).error(f"Unhandled error during run: {e}")
+                    else:
+                        self.log.error(f"Unhandled error during run: {e!r}")
+                    self._backoff("EXCEPTION", 5)
                     self.runs_completed += 1
 
         except KeyboardInterrupt:
@@ -267,6 +307,27 @@ class BotRunner:
         finally:
             self.shutdown()
 
+    def _backoff(self, status: str, base: float, run_time: float = 0.0) -> None:
+        """
+        Pause after a failed run, doubling with each consecutive failure
+        of the same status.
+
+        Args:
+            status: Failure kind whose streak is extended
+            base: Pause after the first failure in a streak (seconds)
+            run_time: Duration of the failed run; long runs skip the pause
+        """
+        streak = self._failure_streaks.get(status, 0) + 1
+        self._failure_streaks[status] = streak
+        if run_time > self.NATURAL_PACING:
+            return
+        delay = min(self.MAX_BACKOFF, base * 2 ** min(streak - 1, 5))
+        if streak > 1:
+            self.log.info(
+                f"{streak} {status.lower()} results in a row, pausing {delay:.0f}s"
+            )
+        time.sleep(delay)
+
     def shutdown(self):
         """Clean shutdown of bot components."""
         self.log.info("Shutting down bot...")
@@ -276,6 +337,10 @@ class BotRunner:
         if self.health_monitor:
             self.health_monitor.stop_monitoring()
 
+        # Stop background capture
+        if self.capture:
+            self.capture.stop_stream()
+
         # Print final stats
         self._print_session_summary()
 
@@ -360,6 +425,21 @@ def start(ctx, run: str, count: int):
     log.info(f"Log level: {ctx.obj['log_level']}")
     log.info("")
 
+    bot: Optional[BotRunner] = None
+
+    # Setup signal handlers for clean shutdown; installed before startup so
+    # a signal during initialize() exits instead of being lost when start()
+    # sets running again
+    def signal_handler(signum, frame):
+        log.info("\nReceived shutdown signal")
+        if bot is not None and bot.running:
+            bot.running = False
+        else:
+            sys.exit(0)
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
     try:
         # Load configuration
         config_manager = ConfigManager()
@@ -367,14 +447,6 @@ def start(ctx, run: str, count: int):
         # Create and initialize bot runner
         bot = BotRunner(run_type=run, run_count=count, config_manager=config_manager)
 
-        # Setup signal handlers for clean shutdown
-        def signal_handler(signum, frame):
-            log.info("\nReceived shutdown signal")
-            bot.running = False
-
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-
         # Initialize components
         bot.initialize()
 
@@ -382,7 +454,7 @@ def start(ctx, run: str, count: int):
         bot.start()
 
     except Exception as e:
-        log.error(f"Fatal error: {e}", exc_info=True)
+        log.opt(exception=e).error(f"Fatal error: {e}")
         sys.exit(1)
 
 
@@ -217,6 +217,10 @@ VALID_TRANSITIONS: Dict[BotState, Set[BotState]] = {
 }
 
 
+# Shared fallback so lookups don't build an empty set per call
+_NO_TRANSITIONS: frozenset = frozenset()
+
+
 class StateTransitionError(Exception):
     """Invalid state transition attempted."""
     pass
@@ -248,7 +252,7 @@ class BotStateMachine:
         # State tracking
         self._state = BotState.IDLE
         self._previous_state: Optional[BotState] = None
-        self._state_start_time = time.time()
+        self._state_start_time = time.monotonic()
 
         # Handlers
         self._state_handlers: Dict[BotState, Callable] = {}
@@ -258,7 +262,13 @@ class BotStateMachine:
         # Control
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+        # Orders whole transitions (exit handler -> swap -> entry handler).
+        # Reentrant so a handler may itself call transition_to.
+        self._transition_lock = threading.RLock()
+        # Guards only the state swap and notify_all, never a handler, so a
+        # plain Lock does and wait_for_state is never held up by a callback.
+        # Property reads below are single attribute loads and take no lock.
+        self._cond = threading.Condition(threading.Lock())
 
     @property
     def state(self) -> BotState:
@@ -273,7 +283,7 @@ class BotStateMachine:
     @property
     def state_duration(self) -> float:
         """Get time in current state (seconds)."""
-        return time.time() - self._state_start_time
+        return time.monotonic() - self._state_start_time
 
     @property
     def is_running(self) -> bool:
@@ -282,8 +292,7 @@ class BotStateMachine:
 
     def can_transition_to(self, target: BotState) -> bool:
         """Check if transition to target state is valid."""
-        valid_targets = VALID_TRANSITIONS.get(self._state, set())
-        return target in valid_targets
+        return target in VALID_TRANSITIONS.get(self._state, _NO_TRANSITIONS)
 
     def transition_to(self, target: BotState, force: bool = False) -> bool:
         """
@@ -299,37 +308,41 @@ class BotStateMachine:
         Raises:
             StateTransitionError: If transition is invalid and not forced
         """
-        with self._lock:
-            if self._state == target:
+        # Handlers run under the transition lock only, so slow callbacks
+        # keep transitions ordered without blocking wait_for_state()
+        with self._transition_lock:
+            previous = self._state
+            if previous == target:
                 return True  # Already in target state
 
             if not force and not self.can_transition_to(target):
                 raise StateTransitionError(
-                    f"Cannot transition from {self._state.name} to {target.name}"
+                    f"Cannot transition from {previous.name} to {target.name}"
                 )
 
             # Call exit handler for current state
-            exit_handler = self._exit_handlers.get(self._state)
+            exit_handler = self._exit_handlers.get(previous)
             if exit_handler:
                 try:
-                    exit_handler(self._state, target)
+                    exit_handler(previous, target)
                 except Exception as e:
-                    self.log.error(f"Exit handler error for {self._state.name}: {e}")
+                    self.log.error(f"Exit handler error for {previous.name}: {e}")
 
             # Update state
-            self._previous_state = self._state
-            self._state = target
-            self._state_start_time = time.time()
+            with self._cond:
+                self._previous_state = previous
+                self._state = target
+                self._state_start_time = time.monotonic()
+                self._cond.notify_all()
 
-            self.log.info(
-                f"State: {self._previous_state.name} -> {target.name}"
-            )
+            # {.name} is resolved by the formatter, only if the record is emitted
+            self.log.info("State: {.name} -> {.name}", previous, target)
 
             # Call entry handler for new state
             entry_handler = self._entry_handlers.get(target)
             if entry_handler:
                 try:
-                    entry_handler(self._previous_state, target)
+                    entry_handler(previous, target)
                 except Exception as e:
                     self.log.error(f"Entry handler error for {target.name}: {e}")
 
@@ -424,10 +437,11 @@ class BotStateMachine:
 
     def _run_loop(self) -> None:
         """Main loop that runs in background thread."""
+        # Ticks follow a fixed deadline so handler time doesn't stretch the period
+        deadline = time.monotonic()
         while self._running:
             try:
                 self.update()
-                time.sleep(self.tick_rate)
             except Exception as e:
                 self.log.error(f"Main loop error: {e}")
                 if self._state != BotState.ERROR:
@@ -436,6 +450,14 @@ class BotStateMachine:
                     except StateTransitionError:
                         pass
 
+            deadline += self.tick_rate
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                # Fell behind; resync instead of bursting to catch up
+                deadline = time.monotonic()
+
     def wait_for_state(
         self,
         target: BotState,
@@ -451,12 +473,11 @@ class BotStateMachine:
         Returns:
             True if state was reached, False on timeout
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            if self._state == target:
-                return True
-            time.sleep(0.1)
-        return False
+        # Lock-free fast path when the target is already current
+        if self._state == target:
+            return True
+        with self._cond:
+            return self._cond.wait_for(lambda: self._state == target, timeout=timeout)
 
     def run_synchronously(self, max_ticks: int = 100) -> None:
         """
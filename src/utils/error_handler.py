@@ -1,9 +1,12 @@
 """Error detection and recovery system for D2R Bot."""
 
+import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, Dict, List, Optional, Tuple
+from itertools import islice
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from src.utils.logger import get_logger
 
@@ -39,6 +42,14 @@ ERROR_CLASSIFICATION: Dict[ErrorType, ErrorSeverity] = {
     ErrorType.GAME_CRASH: ErrorSeverity.CRITICAL,
 }
 
+# Recovery strategy (ErrorHandler method name) for each recoverable error
+RECOVERY_STRATEGIES: Dict[ErrorType, str] = {
+    ErrorType.STUCK: "_recover_stuck",
+    ErrorType.TEMPLATE_FAIL: "_recover_template_fail",
+    ErrorType.TIMEOUT: "_recover_timeout",
+    ErrorType.INVENTORY_FULL: "_recover_inventory_full",
+}
+
 
 @dataclass
 class BotError:
@@ -85,8 +96,8 @@ class StuckDetector:
         """
         self.threshold = threshold
         self.distance_threshold = distance_threshold
-        self._history: List[PositionSample] = []
         self._max_history = 20
+        self._history: Deque[PositionSample] = deque(maxlen=self._max_history)
         self.log = get_logger()
 
     def update(self, x: int, y: int) -> bool:
@@ -100,28 +111,26 @@ class StuckDetector:
         Returns:
             True if character appears stuck
         """
-        sample = PositionSample(x=x, y=y)
-        self._history.append(sample)
-
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
+        # Oldest sample is evicted automatically at _max_history
+        self._history.append(PositionSample(x=x, y=y))
 
-        if len(self._history) < self.threshold:
+        count = len(self._history)
+        if count < self.threshold:
             return False
 
         # Check if last N positions are all similar
-        recent = self._history[-self.threshold:]
-        reference = recent[0]
+        recent = islice(self._history, count - self.threshold, None)
+        reference = next(recent)
 
-        for sample in recent[1:]:
+        for sample in recent:
             dx = abs(sample.x - reference.x)
             dy = abs(sample.y - reference.y)
             if dx > self.distance_threshold or dy > self.distance_threshold:
                 return False
 
         self.log.warning(
-            f"Stuck detected: position ~({reference.x}, {reference.y}) "
-            f"for {self.threshold} samples"
+            "Stuck detected: position ~({}, {}) for {} samples",
+            reference.x, reference.y, self.threshold,
         )
         return True
 
@@ -146,6 +155,7 @@ class ErrorHandler:
         game_detector=None,
         combat=None,
         menu_navigator=None,
+        max_history: int = 1024,
     ):
         """
         Initialize error handler.
@@ -157,6 +167,7 @@ class ErrorHandler:
             game_detector: Game state detector
             combat: Combat system (for emergency teleport)
             menu_navigator: Menu navigator
+            max_history: Most recent errors kept in history
         """
         self.max_retries = max_retries
         self.input = input_ctrl
@@ -167,7 +178,10 @@ class ErrorHandler:
         self.log = get_logger()
 
         # State
-        self._error_history: List[BotError] = []
+        self._error_history: Deque[BotError] = deque(maxlen=max_history)
+        self._error_count: int = 0
+        self._recovery_attempts: int = 0
+        self._recoveries: int = 0
         self._retry_count: int = 0
         self._consecutive_errors: int = 0
         self._last_error_time: float = 0
@@ -210,9 +224,10 @@ class ErrorHandler:
             message=message,
         )
         self._error_history.append(error)
+        self._error_count += 1
 
         self.log.warning(
-            f"Error: {error_type.value} ({severity.name}) - {message}"
+            "Error: {.value} ({.name}) - {}", error_type, severity, message
         )
 
         # Track consecutive errors
@@ -246,35 +261,29 @@ class ErrorHandler:
 
         if self._retry_count > self.max_retries:
             self.log.warning(
-                f"Max retries ({self.max_retries}) exceeded for "
-                f"{error.error_type.value} - ending run"
+                "Max retries ({}) exceeded for {.value} - ending run",
+                self.max_retries, error.error_type,
             )
             self._retry_count = 0
             return ErrorResolution.END_RUN
 
         # Attempt recovery based on error type
-        recovered = False
-
-        if error.error_type == ErrorType.STUCK:
-            recovered = self._recover_stuck()
-        elif error.error_type == ErrorType.TEMPLATE_FAIL:
-            recovered = self._recover_template_fail()
-        elif error.error_type == ErrorType.TIMEOUT:
-            recovered = self._recover_timeout()
-        elif error.error_type == ErrorType.INVENTORY_FULL:
-            recovered = self._recover_inventory_full()
+        strategy = RECOVERY_STRATEGIES.get(error.error_type)
+        recovered = getattr(self, strategy)() if strategy else False
 
         error.recovery_attempted = True
         error.recovered = recovered
+        self._recovery_attempts += 1
+        self._recoveries += recovered
 
         if recovered:
-            self.log.info(f"Recovered from {error.error_type.value}")
+            self.log.info("Recovered from {.value}", error.error_type)
             self._consecutive_errors = 0
             if self._on_recovery:
                 self._on_recovery(error)
             return ErrorResolution.CONTINUE
         else:
-            self.log.warning(f"Recovery failed for {error.error_type.value}")
+            self.log.warning("Recovery failed for {.value}", error.error_type)
             return ErrorResolution.END_RUN
 
     def _handle_run_ending(self, error: BotError) -> ErrorResolution:
@@ -294,7 +303,7 @@ class ErrorHandler:
 
     def _handle_critical(self, error: BotError) -> ErrorResolution:
         """Handle a critical error."""
-        self.log.error(f"CRITICAL ERROR: {error.error_type.value} - {error.message}")
+        self.log.error("CRITICAL ERROR: {.value} - {}", error.error_type, error.message)
 
         if self._on_critical:
             self._on_critical(error)
@@ -317,11 +326,12 @@ class ErrorHandler:
         """
         self.log.info("Attempting stuck recovery")
 
+        # Random direction on screen
+        x = random.randint(400, 1500)
+        y = random.randint(200, 800)
+
         if self.combat:
-            import random
             # Teleport in a random direction
-            x = random.randint(400, 1500)
-            y = random.randint(200, 800)
             self.combat.cast_teleport((x, y))
             time.sleep(0.5)
             self.stuck_detector.reset()
@@ -329,9 +339,6 @@ class ErrorHandler:
 
         if self.input:
             # Without combat, try clicking in a random direction
-            import random
-            x = random.randint(400, 1500)
-            y = random.randint(200, 800)
             self.input.click(x, y)
             time.sleep(1.0)
             return True
@@ -429,20 +436,18 @@ class ErrorHandler:
     # ========== Statistics ==========
 
     def get_error_history(self) -> List[BotError]:
-        """Get error history."""
-        return self._error_history.copy()
+        """Get recent error history (up to max_history errors)."""
+        return list(self._error_history)
 
     def get_error_count(self) -> int:
         """Get total error count."""
-        return len(self._error_history)
+        return self._error_count
 
     def get_recovery_rate(self) -> float:
         """Get percentage of errors that were recovered."""
-        attempted = [e for e in self._error_history if e.recovery_attempted]
-        if not attempted:
+        if not self._recovery_attempts:
             return 0.0
-        recovered = sum(1 for e in attempted if e.recovered)
-        return (recovered / len(attempted)) * 100
+        return (self._recoveries / self._recovery_attempts) * 100
 
     def clear_error_state(self) -> None:
         """Reset error tracking (e.g., after successful run)."""
@@ -1,5 +1,6 @@
 """Screen capture module using mss for fast screenshots."""
 
+import threading
 import time
 from typing import Optional, Tuple
 
@@ -17,6 +18,13 @@ try:
 except ImportError:
     HAS_WIN32 = False
 
+# Optional DXGI capture backend for background streaming (Windows only)
+try:
+    import bettercam
+    HAS_BETTERCAM = True
+except ImportError:
+    HAS_BETTERCAM = False
+
 
 class ScreenCapture:
     """
@@ -50,11 +58,24 @@ class ScreenCapture:
         self._cached_frame: Optional[np.ndarray] = None
         self._cache_time: float = 0
 
+        # Capture counter
+        self._frame_seq: int = 0
+
+        # grab() runs on both the bot and health monitor threads
+        self._lock = threading.Lock()
+
+        # Grayscale conversion of the frame with sequence number _gray_seq
+        self._gray_seq: int = -1
+        self._gray_frame: Optional[np.ndarray] = None
+
         # Window state
         self._window_rect: Optional[Tuple[int, int, int, int]] = None
         self._last_window_check: float = 0
         self._window_check_interval: float = 1.0  # Check window position every 1s
 
+        # Background stream (BetterCam), started with start_stream()
+        self._camera = None
+
     def _find_window(self) -> Optional[Tuple[int, int, int, int]]:
         """
         Find the game window position.
@@ -136,12 +157,20 @@ class ScreenCapture:
         """
         Capture the game screen.
 
+        Safe to call from several threads; each capture returns a new
+        array, so a frame stays valid for as long as the caller holds it.
+
         Args:
             use_cache: Whether to use cached frame if available
 
         Returns:
             Screenshot as numpy array (BGR format for OpenCV)
         """
+        with self._lock:
+            return self._grab_locked(use_cache)
+
+    def _grab_locked(self, use_cache: bool) -> np.ndarray:
+        """grab() body; the caller must hold self._lock."""
         current_time = time.time()
 
         # Return cached frame if still valid
@@ -152,20 +181,102 @@ class ScreenCapture:
         ):
             return self._cached_frame
 
+        # Read the latest streamed frame instead of capturing synchronously
+        if self._camera is not None:
+            frame = self._camera.get_latest_frame()
+            if frame is not None:
+                self._cached_frame = frame
+                self._cache_time = current_time
+                self._frame_seq += 1
+                return frame
+
         # Capture new frame
         monitor = self._build_monitor()
         screenshot = self.sct.grab(monitor)
 
-        # Convert to numpy array (BGRA -> BGR)
-        frame = np.array(screenshot)
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        # Convert straight from a zero-copy view of the BGRA bytes
+        frame = cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_BGRA2BGR)
 
         # Update cache
         self._cached_frame = frame
         self._cache_time = current_time
+        self._frame_seq += 1
 
         return frame
 
+    def grab_gray(self, use_cache: bool = True) -> np.ndarray:
+        """
+        Capture the game screen in grayscale.
+
+        Each captured frame is converted once; callers sharing a cached
+        frame share its grayscale version too.
+
+        Args:
+            use_cache: Whether to use cached frame if available
+
+        Returns:
+            Screenshot as single-channel numpy array
+        """
+        with self._lock:
+            frame = self._grab_locked(use_cache)
+            if self._gray_seq != self._frame_seq:
+                self._gray_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                self._gray_seq = self._frame_seq
+            return self._gray_frame
+
+    def start_stream(self, target_fps: int = 60) -> bool:
+        """
+        Start background capture so grab() reads the latest buffered frame.
+
+        Requires bettercam; without it grab() keeps capturing synchronously.
+
+        Args:
+            target_fps: Capture rate of the background stream
+
+        Returns:
+            True if the stream is running
+        """
+        if self._camera is not None:
+            return True
+
+        if not HAS_BETTERCAM:
+            self.log.debug("bettercam not available, using synchronous capture")
+            return False
+
+        region = None
+        window_rect = self._get_window_rect()
+        if window_rect:
+            left, top, width, height = window_rect
+            region = (left, top, left + width, top + height)
+
+        try:
+            # Single-slot buffer: always hand out the freshest frame
+            camera = bettercam.create(output_idx=0, output_color="BGR", max_buffer_len=1)
+            camera.start(region=region, target_fps=target_fps, video_mode=True)
+        except Exception as e:
+            self.log.warning(f"Could not start capture stream: {e}")
+            return False
+
+        self._camera = camera
+        self.log.info(f"Capture stream started ({target_fps} fps)")
+        return True
+
+    def stop_stream(self) -> None:
+        """Stop background capture and return to synchronous grabs."""
+        if self._camera is None:
+            return
+
+        try:
+            self._camera.stop()
+        except Exception as e:
+            self.log.warning(f"Error stopping capture stream: {e}")
+        self._camera = None
+        self.invalidate_cache()
+
+    def is_streaming(self) -> bool:
+        """Check if background capture is running."""
+        return self._camera is not None
+
     def grab_region(
         self,
         region: Tuple[int, int, int, int],
@@ -247,8 +358,10 @@ class ScreenCapture:
 
     def invalidate_cache(self) -> None:
         """Force the next grab() to capture a new frame."""
-        self._cached_frame = None
-        self._cache_time = 0
+        with self._lock:
+            self._cached_frame = None
+            self._cache_time = 0
+            self._gray_seq = -1
 
     def get_frame_dimensions(self) -> Tuple[int, int]:
         """
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import cv2
 import numpy as np
@@ -58,6 +58,9 @@ class TemplateMatcher:
     # Minimum distance between matches to consider them distinct
     DEFAULT_MIN_DISTANCE = 10
 
+    # Smallest downscaled template side for a coarse-to-fine search
+    MIN_COARSE_SIZE = 8
+
     def __init__(
         self,
         template_dir: str = "assets/templates",
@@ -80,6 +83,9 @@ class TemplateMatcher:
         # Template cache: name -> (template_image, grayscale_version)
         self._cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
 
+        # Names that failed to load, so lookups skip the disk until clear_cache()
+        self._missing: Set[str] = set()
+
     def _get_template_path(self, name: str) -> Path:
         """
         Get full path for a template name.
@@ -110,17 +116,21 @@ class TemplateMatcher:
         # Check cache first
         if name in self._cache:
             return self._cache[name][0]
+        if name in self._missing:
+            return None
 
         path = self._get_template_path(name)
 
         if not path.exists():
             self.log.warning(f"Template not found: {path}")
+            self._missing.add(name)
             return None
 
         # Load image
         template = cv2.imread(str(path), cv2.IMREAD_COLOR)
         if template is None:
             self.log.error(f"Failed to load template: {path}")
+            self._missing.add(name)
             return None
 
         # Create grayscale version for matching
@@ -182,9 +192,113 @@ class TemplateMatcher:
                 return None
             search_img = screen
 
+        return self._match_best(search_img, template, threshold)
+
+    def get_template_gray(self, name: str) -> Optional[np.ndarray]:
+        """
+        Get the cached grayscale version of a template for find_cached().
+
+        Args:
+            name: Template name (e.g., "objects/durance_stairs")
+
+        Returns:
+            Grayscale template, or None if not found
+        """
+        return self._get_template_gray(name)
+
+    def find_cached(
+        self,
+        screen: np.ndarray,
+        template: np.ndarray,
+        threshold: Optional[float] = None,
+        downscale: int = 1,
+        coarse_threshold: Optional[float] = None,
+    ) -> Optional[Match]:
+        """
+        Find the best match of an already-loaded grayscale template.
+
+        Skips the per-call name/cache lookup of find(); use with
+        get_template_gray() for templates searched every frame.
+
+        Args:
+            screen: Screenshot to search in (BGR or grayscale)
+            template: Grayscale template image
+            threshold: Minimum confidence threshold (default: self.default_threshold)
+            downscale: Locate the match on a 1/downscale image first, then
+                       score it at full resolution around that spot
+            coarse_threshold: With downscale, give up without the
+                              full-resolution pass if the coarse score is
+                              below this (looser than threshold)
+
+        Returns:
+            Match object if found above threshold, None otherwise
+        """
+        if threshold is None:
+            threshold = self.default_threshold
+
+        if screen.ndim == 3:
+            screen = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
+
+        return self._match_best(screen, template, threshold, downscale, coarse_threshold)
+
+    def _match_best(
+        self,
+        search_img: np.ndarray,
+        template: np.ndarray,
+        threshold: float,
+        downscale: int = 1,
+        coarse_threshold: Optional[float] = None,
+    ) -> Optional[Match]:
+        """Run matchTemplate and return the best location above threshold."""
         # Get template dimensions
         h, w = template.shape[:2]
 
+        # Coarse-to-fine: only search a small window around the coarse hit
+        offset_x = offset_y = 0
+        if downscale > 1 and min(h, w) // downscale >= self.MIN_COARSE_SIZE:
+            coarse = self._locate(
+                cv2.resize(search_img, None, fx=1 / downscale, fy=1 / downscale,
+                           interpolation=cv2.INTER_AREA),
+                cv2.resize(template, None, fx=1 / downscale, fy=1 / downscale,
+                           interpolation=cv2.INTER_AREA),
+            )
+            if coarse is None:
+                return None
+            if coarse_threshold is not None and coarse[1] < coarse_threshold:
+                return None
+
+            pad = downscale * 2
+            img_h, img_w = search_img.shape[:2]
+            offset_x = max(0, coarse[0][0] * downscale - pad)
+            offset_y = max(0, coarse[0][1] * downscale - pad)
+            search_img = search_img[
+                offset_y:min(img_h, offset_y + h + 2 * pad),
+                offset_x:min(img_w, offset_x + w + 2 * pad),
+            ]
+
+        located = self._locate(search_img, template)
+        if located is None:
+            return None
+        loc, confidence = located
+
+        # Check threshold
+        if confidence < threshold:
+            return None
+
+        return Match(
+            x=loc[0] + offset_x,
+            y=loc[1] + offset_y,
+            width=w,
+            height=h,
+            confidence=confidence,
+        )
+
+    def _locate(
+        self,
+        search_img: np.ndarray,
+        template: np.ndarray,
+    ) -> Optional[Tuple[Tuple[int, int], float]]:
+        """Run matchTemplate and return (best location, confidence)."""
         # Perform template matching
         try:
             result = cv2.matchTemplate(search_img, template, self.method)
@@ -198,22 +312,9 @@ class TemplateMatcher:
         # For TM_SQDIFF methods, minimum is best match
         if self.method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED):
             confidence = 1 - min_val if self.method == cv2.TM_SQDIFF_NORMED else min_val
-            loc = min_loc
-        else:
-            confidence = max_val
-            loc = max_loc
+            return min_loc, confidence
 
-        # Check threshold
-        if confidence < threshold:
-            return None
-
-        return Match(
-            x=loc[0],
-            y=loc[1],
-            width=w,
-            height=h,
-            confidence=confidence,
-        )
+        return max_loc, max_val
 
     def find_all(
         self,
@@ -344,6 +445,9 @@ class TemplateMatcher:
         """
         Find the first matching template from a list.
 
+        The screen is converted to grayscale once and shared by all
+        templates.
+
         Args:
             screen: Screenshot to search in
             template_names: List of template names to try
@@ -352,8 +456,15 @@ class TemplateMatcher:
         Returns:
             Tuple of (template_name, Match) or None if none found
         """
+        if threshold is None:
+            threshold = self.default_threshold
+
+        search_img = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
         for name in template_names:
-            match = self.find(screen, name, threshold)
+            template = self._get_template_gray(name)
+            if template is None:
+                continue
+            match = self._match_best(search_img, template, threshold)
             if match:
                 return (name, match)
         return None
@@ -375,11 +486,18 @@ class TemplateMatcher:
         Returns:
             Tuple of (template_name, Match) with highest confidence, or None
         """
+        if threshold is None:
+            threshold = self.default_threshold
+
         best_name = None
         best_match = None
 
+        search_img = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)
         for name in template_names:
-            match = self.find(screen, name, threshold)
+            template = self._get_template_gray(name)
+            if template is None:
+                continue
+            match = self._match_best(search_img, template, threshold)
             if match and (best_match is None or match.confidence > best_match.confidence):
                 best_name = name
                 best_match = match
@@ -408,6 +526,7 @@ class TemplateMatcher:
     def clear_cache(self) -> None:
         """Clear the template cache."""
         self._cache.clear()
+        self._missing.clear()
         self.log.debug("Template cache cleared")
 
     def get_cached_templates(self) -> List[str]:
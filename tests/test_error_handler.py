@@ -10,6 +10,7 @@ from src.utils.error_handler import (
     StuckDetector,
     BotError,
     ERROR_CLASSIFICATION,
+    RECOVERY_STRATEGIES,
 )
 from src.utils.logger import setup_logger, get_logger
 
@@ -72,6 +73,11 @@ def test_error_classification():
     assert ERROR_CLASSIFICATION[ErrorType.TEMPLATE_FAIL] == ErrorSeverity.RECOVERABLE
     assert ERROR_CLASSIFICATION[ErrorType.DISCONNECT] == ErrorSeverity.RUN_ENDING
 
+    # Every recoverable error has a recovery strategy
+    for error_type, severity in ERROR_CLASSIFICATION.items():
+        if severity == ErrorSeverity.RECOVERABLE:
+            assert hasattr(ErrorHandler, RECOVERY_STRATEGIES[error_type])
+
     log.info("PASSED: error classification")
     return True
 
@@ -250,6 +256,25 @@ def test_error_count():
     return True
 
 
+def test_error_history_bounded():
+    """Test error history is capped while totals keep counting."""
+    log = get_logger()
+    log.info("Testing bounded error history...")
+
+    handler = ErrorHandler(max_retries=100, max_history=3)
+
+    for i in range(5):
+        handler.handle(ErrorType.INVENTORY_FULL, str(i))
+
+    history = handler.get_error_history()
+    assert [e.message for e in history] == ["2", "3", "4"]
+    assert handler.get_error_count() == 5
+    assert handler.get_recovery_rate() == 0.0
+
+    log.info("PASSED: bounded error history")
+    return True
+
+
 def test_recovery_rate():
     """Test recovery rate calculation."""
     log = get_logger()
@@ -392,6 +417,26 @@ def test_stuck_detector_not_enough_samples():
     return True
 
 
+def test_stuck_detector_history_bounded():
+    """Test stuck detector keeps a bounded window and still detects."""
+    log = get_logger()
+    log.info("Testing stuck detector history bound...")
+
+    detector = StuckDetector(threshold=3, distance_threshold=10)
+
+    for i in range(50):
+        detector.update(i * 50, i * 50)
+    assert len(detector._history) == detector._max_history
+
+    # Only the newest samples count toward stuck
+    assert detector.update(100, 100) is False
+    assert detector.update(101, 100) is False
+    assert detector.update(100, 101) is True
+
+    log.info("PASSED: stuck detector history bound")
+    return True
+
+
 def test_check_stuck_integration():
     """Test check_stuck integration in ErrorHandler."""
     log = get_logger()
@@ -492,6 +537,7 @@ def run_all_tests():
         ("Consecutive Errors", test_consecutive_errors_escalation),
         ("Error History", test_error_history),
         ("Error Count", test_error_count),
+        ("Bounded Error History", test_error_history_bounded),
         ("Recovery Rate", test_recovery_rate),
         ("Empty Recovery Rate", test_recovery_rate_empty),
         ("Clear Error State", test_clear_error_state),
@@ -500,6 +546,7 @@ def run_all_tests():
         ("Stuck Detector Triggers", test_stuck_detector_triggers),
         ("Stuck Detector Reset", test_stuck_detector_reset),
         ("Insufficient Samples", test_stuck_detector_not_enough_samples),
+        ("Stuck Detector History Bound", test_stuck_detector_history_bounded),
         ("Check Stuck Integration", test_check_stuck_integration),
         ("Reset Stuck", test_reset_stuck),
         ("BotError Dataclass", test_bot_error_dataclass),
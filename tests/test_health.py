@@ -81,6 +81,37 @@ def test_start_stop_monitoring():
     return True
 
 
+def test_arm_disarm_keeps_thread():
+    """Test arm/disarm toggles checks without restarting the thread."""
+    log = get_logger()
+    log.info("Testing arm/disarm...")
+
+    monitor, _, _, capture = create_mock_health_monitor()
+
+    monitor.arm()
+    assert monitor.is_monitoring()
+    assert monitor.is_armed()
+    thread = monitor._thread
+
+    monitor.disarm()
+    assert not monitor.is_armed()
+    time.sleep(0.05)
+    calls = capture.grab.call_count
+    time.sleep(0.05)
+    assert capture.grab.call_count == calls
+
+    monitor.arm()
+    assert monitor._thread is thread
+    time.sleep(0.05)
+    assert capture.grab.call_count > calls
+
+    monitor.stop_monitoring()
+    assert not monitor.is_monitoring()
+
+    log.info("PASSED: arm/disarm")
+    return True
+
+
 def test_health_status_safe():
     """Test health status when safe."""
     log = get_logger()
@@ -165,6 +196,42 @@ def test_check_health():
     return True
 
 
+def test_is_safe_uses_monitor_reading():
+    """Test is_safe reuses fresh monitor readings instead of capturing."""
+    log = get_logger()
+    log.info("Testing is_safe...")
+
+    monitor, _, detector, capture = create_mock_health_monitor(health=80.0)
+
+    # Not monitoring: falls back to a synchronous check
+    assert monitor.is_safe() is True
+    assert capture.grab.call_count == 1
+
+    # Fresh reading from the (simulated) monitor loop: no capture needed
+    monitor._running = True
+    monitor._armed.set()
+    monitor.state.status = HealthStatus.SAFE
+    monitor.state.last_check_time = time.time()
+    assert monitor.is_safe() is True
+    assert capture.grab.call_count == 1
+
+    # Critical reading outside the grace period is unsafe
+    monitor.state.status = HealthStatus.CRITICAL
+    monitor._start_time = time.time() - 10
+    assert monitor.is_safe() is False
+    assert capture.grab.call_count == 1
+
+    # Stale reading falls back to check_health()
+    monitor.state.last_check_time = time.time() - 10
+    assert monitor.is_safe() is True
+    assert capture.grab.call_count == 2
+
+    monitor._running = False
+
+    log.info("PASSED: is_safe")
+    return True
+
+
 def test_use_potion():
     """Test potion usage."""
     log = get_logger()
@@ -225,6 +292,7 @@ def test_chicken_execution():
 
     # Should be marked as triggered
     assert monitor.state.chicken_triggered is True
+    assert monitor.chicken_event.is_set()
 
     # Should have history entry
     assert monitor.get_chicken_count() == 1
@@ -270,6 +338,7 @@ def test_reset_chicken_flag():
 
     monitor.reset_chicken_flag()
     assert monitor.state.chicken_triggered is False
+    assert not monitor.chicken_event.is_set()
 
     log.info("PASSED: reset chicken flag")
     return True
@@ -474,11 +543,13 @@ def run_all_tests():
     tests = [
         ("Initial State", test_initial_state),
         ("Start/Stop Monitoring", test_start_stop_monitoring),
+        ("Arm/Disarm", test_arm_disarm_keeps_thread),
         ("Health Status Safe", test_health_status_safe),
         ("Health Status Warning", test_health_status_warning),
         ("Health Status Critical", test_health_status_critical),
         ("Mana Chicken", test_mana_chicken),
         ("Check Health", test_check_health),
+        ("Is Safe", test_is_safe_uses_monitor_reading),
         ("Use Potion", test_use_potion),
         ("Potion Cooldown", test_potion_cooldown),
         ("Chicken Execution", test_chicken_execution),
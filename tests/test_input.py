@@ -1,9 +1,11 @@
 """Tests for input controller module."""
 
 import math
+import random
+import time
 from unittest.mock import Mock, patch
 
-from src.input.mouse import wind_mouse, generate_path, MouseMover
+from src.input.mouse import wind_mouse, generate_path, MouseMover, _precise_sleep
 from src.input.keyboard import KeyboardController
 from src.input.controller import InputController
 from src.utils.logger import setup_logger, get_logger
@@ -142,8 +144,12 @@ def test_keyboard_combo():
         key_up=lambda k: key_ups.append(k),
     )
 
-    kb.press_combo("ctrl", "c", hold_time=0.001)
+    with patch("src.input.keyboard.time.sleep") as sleep:
+        kb.press_combo("ctrl", "c", hold_time=0.001)
 
+    # Press, hold and release each sleep once
+    assert sleep.call_count == 3
+    assert key_ups == ["c", "ctrl"], "Should release in reverse order"
     assert "ctrl" in key_downs, "Should press ctrl"
     assert "c" in key_downs, "Should press c"
     assert "ctrl" in key_ups, "Should release ctrl"
@@ -153,6 +159,63 @@ def test_keyboard_combo():
     return True
 
 
+def test_type_text_fast():
+    """Test non-human typing presses every key without sleeping."""
+    log = get_logger()
+    log.info("Testing fast type_text...")
+
+    kb = KeyboardController()
+    presses = []
+    kb.set_key_functions(
+        key_down=lambda k: None,
+        key_up=lambda k: None,
+        press=lambda k: presses.append(k),
+    )
+
+    with patch("src.input.keyboard.time.sleep") as sleep:
+        kb.type_text("hello", human_like=False)
+
+    assert presses == list("hello")
+    sleep.assert_not_called()
+
+    # A bulk backend writes the whole string in one call
+    typed = []
+    kb.set_key_functions(
+        key_down=lambda k: None,
+        key_up=lambda k: None,
+        press=lambda k: presses.append(k),
+        type_str=typed.append,
+    )
+    kb.type_text("world", human_like=False)
+    assert typed == ["world"]
+    assert presses == list("hello")
+
+    log.info("PASSED: fast type_text")
+    return True
+
+
+def test_missing_backend_warns_once():
+    """Test missing keyboard/mouse backends log a single warning each."""
+    log = get_logger()
+    log.info("Testing missing backend warnings...")
+
+    kb = KeyboardController(key_delay=(0, 0))
+    kb.log = Mock()
+    for _ in range(5):
+        kb.press("a")
+        kb.key_up("a")
+    assert kb.log.warning.call_count == 2
+
+    mover = MouseMover()
+    mover.log = Mock()
+    for _ in range(5):
+        mover.move_to(10, 10)
+    mover.log.warning.assert_called_once()
+
+    log.info("PASSED: missing backend warnings")
+    return True
+
+
 def test_input_controller_mock():
     """Test InputController with mocked backend."""
     log = get_logger()
@@ -207,7 +270,7 @@ def test_cast_skill():
 
     controller.keyboard._press_func = lambda k: pressed_keys.append(k)
     controller.keyboard.key_delay = (0, 0)  # No delay
-    controller._click = lambda button="left": clicks.append(button)
+    controller._click = lambda x=None, y=None, button="left": clicks.append(button)
     controller.mouse._move_func = Mock()
     controller.click_delay = (0, 0)  # No delay
 
@@ -221,6 +284,208 @@ def test_cast_skill():
     return True
 
 
+def test_send_sequence():
+    """Test send_sequence dispatches each step in order."""
+    log = get_logger()
+    log.info("Testing send_sequence...")
+
+    controller = InputController(human_like=False)
+
+    events = []
+    controller.keyboard._press_func = lambda k: events.append(("press", k))
+    controller.keyboard._key_down_func = lambda k: events.append(("down", k))
+    controller.keyboard._key_up_func = lambda k: events.append(("up", k))
+    controller.keyboard.key_delay = (0, 0)
+    controller._click = lambda x=None, y=None, button="left": events.append(
+        ("click", (x, y), button)
+    )
+    controller.move_to = lambda x, y: events.append(("move", (x, y)))
+    controller.click_delay = (0, 0)
+
+    controller.send_sequence([
+        ("press", "escape", 0),
+        ("click", (960, 540), 0),
+        ("key_down", "alt", 0),
+        ("key_up", "alt", 0),
+    ])
+
+    # Without human-like input the move is fused into the backend click
+    assert events == [
+        ("press", "escape"),
+        ("click", (960, 540), "left"),
+        ("down", "alt"),
+        ("up", "alt"),
+    ]
+
+    try:
+        controller.send_sequence([("jump", None, 0)])
+        assert False, "Unknown action should raise"
+    except ValueError:
+        pass
+
+    log.info("PASSED: send_sequence")
+    return True
+
+
+def test_click_batch_holds_modifier():
+    """Test click_batch clicks every position while holding the modifier."""
+    log = get_logger()
+    log.info("Testing click_batch...")
+
+    controller = InputController(human_like=False)
+
+    events = []
+    controller.keyboard._key_down_func = lambda k: events.append(("down", k))
+    controller.keyboard._key_up_func = lambda k: events.append(("up", k))
+    controller._click = lambda x=None, y=None, button="left": events.append(
+        ("click", (x, y), button)
+    )
+    controller.move_to = lambda x, y: events.append(("move", (x, y)))
+    controller.click_delay = (0, 0)
+
+    controller.click_batch(
+        [(10, 20), (30, 40)], interval=0, modifier="alt", modifier_delay=0,
+    )
+
+    assert events == [
+        ("down", "alt"),
+        ("click", (10, 20), "left"),
+        ("click", (30, 40), "left"),
+        ("up", "alt"),
+    ]
+
+    log.info("PASSED: click_batch")
+    return True
+
+
+def test_wind_mouse_settles_on_target():
+    """Test wind_mouse settles without orbiting or repeating pixels."""
+    log = get_logger()
+    log.info("Testing wind_mouse settling...")
+
+    for _ in range(100):
+        path = generate_path(100, 100, 900, 600)
+        assert path[-1] == (900, 600)
+        assert len(path) < 1000, f"Path took {len(path)} steps"
+        assert all(a != b for a, b in zip(path, path[1:])), "Repeated pixel emitted"
+
+    log.info("PASSED: wind_mouse settling")
+    return True
+
+
+def test_wind_mouse_seeded_rng():
+    """Test wind_mouse paths are reproducible from a seeded generator."""
+    log = get_logger()
+    log.info("Testing wind_mouse seeded rng...")
+
+    first = generate_path(0, 0, 500, 300, rng=random.Random(42))
+    second = generate_path(0, 0, 500, 300, rng=random.Random(42))
+
+    assert first == second
+    assert first[-1] == (500, 300)
+
+    log.info("PASSED: wind_mouse seeded rng")
+    return True
+
+
+def test_wind_mouse_coalesces_far_steps():
+    """Test wind_mouse emits fewer moves when far steps are coalesced."""
+    log = get_logger()
+    log.info("Testing wind_mouse coalescing...")
+
+    full = generate_path(0, 0, 800, 400, rng=random.Random(7))
+    merged = generate_path(
+        0, 0, 800, 400, rng=random.Random(7), coalesce_steps=4
+    )
+
+    assert merged[-1] == (800, 400)
+    assert len(merged) < len(full)
+    assert set(merged) <= set(full), "Coalescing should only drop points"
+
+    log.info(f"Coalesced {len(full)} points to {len(merged)}")
+    log.info("PASSED: wind_mouse coalescing")
+    return True
+
+
+def test_tiny_moves_skip_simulation():
+    """Test tiny moves jump straight to target and no-op moves are skipped."""
+    log = get_logger()
+    log.info("Testing tiny moves...")
+
+    assert generate_path(100, 100, 102, 101) == [(102, 101)]
+
+    mover = MouseMover(move_delay=(0, 0))
+    moves = []
+    mover.set_move_function(lambda x, y: moves.append((x, y)))
+    mover.set_position(50, 50)
+
+    mover.move_to(50, 50)
+    assert moves == [], "Move to current position should not call backend"
+
+    mover.move_to(51, 52)
+    assert moves == [(51, 52)]
+    assert mover.get_position() == (51, 52)
+
+    log.info("PASSED: tiny moves")
+    return True
+
+
+def test_precise_sleep():
+    """Test step sleeps last at least the requested time without overshoot."""
+    log = get_logger()
+    log.info("Testing precise sleep...")
+
+    for duration in (0.0003, 0.002):
+        start = time.perf_counter()
+        _precise_sleep(duration)
+        elapsed = time.perf_counter() - start
+        assert duration <= elapsed < duration + 0.01, f"Slept {elapsed:.4f}s"
+
+    log.info("PASSED: precise sleep")
+    return True
+
+
+def test_click_human_like_moves_first():
+    """Test human-like clicks still move the cursor before clicking."""
+    log = get_logger()
+    log.info("Testing human-like click...")
+
+    controller = InputController(human_like=True)
+
+    events = []
+    controller._click = lambda x=None, y=None, button="left": events.append(
+        ("click", (x, y), button)
+    )
+    controller.move_to = lambda x, y: events.append(("move", (x, y)))
+    controller.click_delay = (0, 0)
+
+    controller.click(100, 200)
+
+    assert events == [("move", (100, 200)), ("click", (None, None), "left")]
+
+    log.info("PASSED: human-like click")
+    return True
+
+
+def test_double_click_single_backend_call():
+    """Test non-human double-click is one backend call."""
+    log = get_logger()
+    log.info("Testing double_click...")
+
+    controller = InputController(human_like=False)
+    controller._click = Mock()
+
+    controller.double_click(300, 400)
+
+    controller._click.assert_called_once()
+    kwargs = controller._click.call_args.kwargs
+    assert (kwargs["x"], kwargs["y"], kwargs["clicks"]) == (300, 400, 2)
+    assert 0.05 <= kwargs["interval"] <= 0.1
+
+    log.info("PASSED: double_click")
+    return True
+
+
 def run_all_tests():
     """Run all input tests."""
     setup_logger(level="INFO")
@@ -234,12 +499,23 @@ def run_all_tests():
         ("WindMouse Path Generation", test_wind_mouse_generates_path),
         ("WindMouse Path Curvature", test_wind_mouse_path_is_curved),
         ("WindMouse Parameters", test_wind_mouse_respects_parameters),
+        ("WindMouse Settles On Target", test_wind_mouse_settles_on_target),
+        ("WindMouse Seeded RNG", test_wind_mouse_seeded_rng),
+        ("WindMouse Coalesces Far Steps", test_wind_mouse_coalesces_far_steps),
+        ("Tiny Moves Skip Simulation", test_tiny_moves_skip_simulation),
+        ("Precise Sleep", test_precise_sleep),
+        ("Human-like Click Moves First", test_click_human_like_moves_first),
+        ("Double Click Single Backend Call", test_double_click_single_backend_call),
         ("MouseMover", test_mouse_mover),
         ("KeyboardController", test_keyboard_controller),
         ("Keyboard Combo", test_keyboard_combo),
+        ("Type Text Fast", test_type_text_fast),
+        ("Missing Backend Warns Once", test_missing_backend_warns_once),
         ("InputController (Mocked)", test_input_controller_mock),
         ("Path Endpoints", test_path_endpoints),
         ("Cast Skill", test_cast_skill),
+        ("Send Sequence", test_send_sequence),
+        ("Click Batch", test_click_batch_holds_modifier),
     ]
 
     passed = 0
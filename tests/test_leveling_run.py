@@ -1,5 +1,6 @@
 """Tests for leveling run and leveling manager."""
 
+import time
 from unittest.mock import Mock
 
 from src.game.runs.leveling import (
@@ -11,6 +12,8 @@ from src.game.runs.leveling import (
     PhaseConfig,
     PHASE_CONFIGS,
     DIFFICULTY_TRANSITIONS,
+    scale_positions,
+    _noop,
 )
 from src.game.runs import RunStatus, RunResult
 from src.game.combat import SorceressCombat
@@ -116,9 +119,11 @@ def test_difficulty_enum():
     log = get_logger()
     log.info("Testing Difficulty enum...")
 
-    assert Difficulty.NORMAL.value == "normal"
-    assert Difficulty.NIGHTMARE.value == "nightmare"
-    assert Difficulty.HELL.value == "hell"
+    assert Difficulty.NORMAL.label == "normal"
+    assert Difficulty.NIGHTMARE.label == "nightmare"
+    assert Difficulty.HELL.label == "hell"
+    assert Difficulty.NORMAL < Difficulty.NIGHTMARE < Difficulty.HELL
+    assert Difficulty.HELL == 2
 
     log.info("PASSED: Difficulty enum")
     return True
@@ -129,8 +134,8 @@ def test_leveling_phase_enum():
     log = get_logger()
     log.info("Testing LevelingPhase enum...")
 
-    assert LevelingPhase.NORMAL_EARLY.value == "normal_early"
-    assert LevelingPhase.ENDGAME_FARMING.value == "endgame_farming"
+    assert LevelingPhase.NORMAL_EARLY.label == "normal_early"
+    assert LevelingPhase.ENDGAME_FARMING.label == "endgame_farming"
     assert len(LevelingPhase) == 8
 
     log.info("PASSED: LevelingPhase enum")
@@ -244,6 +249,55 @@ def test_execute_chicken():
     return True
 
 
+def test_wait_cut_short_by_chicken():
+    """Test run delays wake early once chicken triggers."""
+    log = get_logger()
+    log.info("Testing chicken-aware wait...")
+
+    run, _, _, _, health, _ = create_mock_leveling_run()
+
+    assert run._wait(0.01) is True
+
+    health.chicken_event.set()
+    start = time.time()
+    assert run._wait(5.0) is False
+    assert time.time() - start < 1.0
+
+    log.info("PASSED: chicken-aware wait")
+    return True
+
+
+def test_blood_moor_cut_short_by_chicken():
+    """Test Blood Moor walking and basic attacks stop on chicken."""
+    log = get_logger()
+    log.info("Testing Blood Moor chicken handling...")
+
+    run, input_ctrl, _, _, health, _ = create_mock_leveling_run(
+        phase=LevelingPhase.BLOOD_MOOR
+    )
+
+    # Chicken on the first attack click: no further attacks, shift released
+    def click(x, y, button=None):
+        if button == "left":
+            health.chicken_event.set()
+
+    input_ctrl.click.side_effect = click
+    start = time.time()
+    assert run._clear_with_basic() == 0
+    # 1.0s move wait, but none of the three 0.3s attack pauses
+    assert time.time() - start < 1.25
+    attacks = [c for c in input_ctrl.click.call_args_list if c.kwargs.get("button")]
+    assert len(attacks) == 1
+    input_ctrl.key_up.assert_called_with("shift")
+
+    # Walk out of town is cut short and reported as a failed departure
+    assert run._waypoint_to_area() is False
+    input_ctrl.key_up.assert_called_with("w")
+
+    log.info("PASSED: Blood Moor chicken handling")
+    return True
+
+
 def test_execute_no_town():
     """Test run fails without town manager."""
     log = get_logger()
@@ -548,6 +602,60 @@ def test_execute_leveling_session_max_runs():
     return True
 
 
+def test_optional_hooks_bound_at_init():
+    """Test optional dependencies are resolved once at construction."""
+    log = get_logger()
+    log.info("Testing optional hook binding...")
+
+    manager, _, _, _ = create_mock_leveling_manager()
+    assert manager._maybe_respec is _noop
+    assert manager._maybe_handle_levelups is _noop
+    assert manager._record_stats is _noop
+
+    stats = Mock()
+    manager = LevelingManager(
+        config=Config(),
+        input_ctrl=Mock(),
+        level_manager=Mock(),
+        screen_capture=Mock(),
+        statistics=stats,
+    )
+    assert manager._maybe_respec == manager._do_respec
+    assert manager._maybe_handle_levelups == manager._handle_pending_levelups
+
+    manager._record_stats(RunResult(status=RunStatus.SUCCESS, kills=2))
+    stats.record_run.assert_called_once()
+    assert stats.record_run.call_args.kwargs["kills"] == 2
+
+    log.info("PASSED: Optional hook binding")
+    return True
+
+
+def test_create_run_reuses_instance():
+    """Test create_run reuses one LevelingRun and rebinds its phase."""
+    log = get_logger()
+    log.info("Testing pooled leveling run...")
+
+    manager, _, _, _ = create_mock_leveling_manager()
+    manager.state.current_level = 5
+
+    run = manager.create_run()
+    run._run_history.append(RunResult(status=RunStatus.SUCCESS))
+    run._phase_times["combat"] = 1.0
+
+    manager.state.current_level = 20
+    second = manager.create_run()
+
+    assert second is run
+    assert run.phase is manager.get_phase_config()
+    assert run.run_timeout == run.phase.run_timeout
+    assert run.get_run_count() == 0
+    assert run.get_phase_times() == {}
+
+    log.info("PASSED: Pooled leveling run")
+    return True
+
+
 def test_phase_config_dataclass():
     """Test PhaseConfig dataclass."""
     log = get_logger()
@@ -576,6 +684,31 @@ def test_phase_config_dataclass():
     return True
 
 
+def test_scale_positions():
+    """Test phase positions are scaled to the configured resolution."""
+    log = get_logger()
+    log.info("Testing position scaling...")
+
+    positions = ((960, 540), (1920, 1080))
+    assert scale_positions(positions, (1920, 1080)) is positions
+    assert scale_positions(positions, (1280, 720)) == ((640, 360), (1280, 720))
+    # 100 * 2/3 = 66.67 rounds up rather than truncating to 66
+    assert scale_positions(((100, 101),), (1280, 720)) == ((67, 67),)
+
+    config = Config()
+    config.resolution = (1280, 720)
+    run = LevelingRun(
+        phase_config=PHASE_CONFIGS[LevelingPhase.NORMAL_EARLY],
+        config=config,
+        input_ctrl=Mock(),
+    )
+    first = PHASE_CONFIGS[LevelingPhase.NORMAL_EARLY].clear_positions[0]
+    assert run._clear_positions[0] == (round(first[0] * 2 / 3), round(first[1] * 2 / 3))
+
+    log.info("PASSED: Position scaling")
+    return True
+
+
 def run_all_tests():
     """Run all leveling run tests."""
     setup_logger(level="INFO")
@@ -594,6 +727,8 @@ def run_all_tests():
         ("Run Timeout From Phase", test_run_timeout_from_phase),
         ("Execute Success", test_execute_success),
         ("Execute Chicken", test_execute_chicken),
+        ("Wait Cut Short By Chicken", test_wait_cut_short_by_chicken),
+        ("Blood Moor Chicken", test_blood_moor_cut_short_by_chicken),
         ("Execute No Town", test_execute_no_town),
         ("Initial State", test_initial_state),
         ("Phase Detection Normal", test_get_current_phase_normal),
@@ -611,7 +746,10 @@ def run_all_tests():
         ("Should Progress Phase", test_should_progress_phase),
         ("LevelingState Dataclass", test_leveling_state_dataclass),
         ("Session Max Runs", test_execute_leveling_session_max_runs),
+        ("Optional Hooks Bound At Init", test_optional_hooks_bound_at_init),
+        ("Create Run Reuses Instance", test_create_run_reuses_instance),
         ("PhaseConfig Dataclass", test_phase_config_dataclass),
+        ("Scale Positions", test_scale_positions),
     ]
 
     passed = 0
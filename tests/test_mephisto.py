@@ -358,6 +358,50 @@ def test_run_result_dataclass():
     return True
 
 
+def test_loot_fallback_batches_clicks():
+    """Test loot fallback sweeps the corpse area in one alt-held batch."""
+    log = get_logger()
+    log.info("Testing loot fallback...")
+
+    run, input_ctrl, _, _, _, _ = create_mock_mephisto_run()
+    run.combat = None
+
+    items = run._loot_area()
+
+    input_ctrl.click_batch.assert_called_once_with(
+        MephistoRun.LOOT_SCAN_POSITIONS, interval=0.15, modifier="alt"
+    )
+    assert items == len(MephistoRun.LOOT_SCAN_POSITIONS)
+
+    log.info("PASSED: loot fallback")
+    return True
+
+
+def test_teleport_and_detect_waits_for_landing():
+    """Test entrance detection runs only once the teleport has landed."""
+    log = get_logger()
+    log.info("Testing teleport and detect...")
+
+    run, _, _, _, _, _ = create_mock_mephisto_run()
+    run.combat = Mock()
+    calls = []
+    run._wait_for_frame_stable = Mock(side_effect=lambda t: calls.append("settle") or True)
+    run._detect_level_3_entrance = Mock(side_effect=lambda: calls.append("detect") or True)
+
+    assert run._teleport_and_detect((960, 300)) is True
+    run.combat.cast_teleport.assert_called_once_with((960, 300))
+    assert calls == ["settle", "detect"], "Should detect after the view settles"
+
+    # Chicken during the wait skips detection
+    calls.clear()
+    run._wait_for_frame_stable = Mock(return_value=False)
+    assert run._teleport_and_detect((960, 300)) is False
+    assert calls == []
+
+    log.info("PASSED: teleport and detect")
+    return True
+
+
 def run_all_tests():
     """Run all Mephisto run tests."""
     setup_logger(level="INFO")
@@ -383,6 +427,8 @@ def run_all_tests():
         ("Run Without Combat", test_run_without_combat),
         ("Callbacks", test_callbacks),
         ("RunResult Dataclass", test_run_result_dataclass),
+        ("Loot Fallback Batches Clicks", test_loot_fallback_batches_clicks),
+        ("Teleport And Detect", test_teleport_and_detect_waits_for_landing),
     ]
 
     passed = 0
@@ -1,8 +1,12 @@
 """Tests for Pindleskin run implementation."""
 
+import tempfile
 import time
+from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 
+import numpy as np
+
 from src.game.runs import PindleRun, RunStatus, RunResult
 from src.game.combat import SorceressCombat, Skill
 from src.game.health import HealthMonitor, HealthStatus
@@ -139,6 +143,24 @@ def test_chicken_triggers_abort():
     return True
 
 
+def test_check_health_reads_chicken_flag():
+    """Test _check_health short-circuits once chicken has fired."""
+    log = get_logger()
+    log.info("Testing chicken flag read...")
+
+    run, _, _, _, health, _ = create_mock_pindle_run()
+    health.is_safe = Mock(return_value=True)
+
+    assert run._check_health() is True
+
+    health.chicken_event.set()
+    assert run._check_health() is False
+    health.is_safe.assert_called_once()
+
+    log.info("PASSED: chicken flag read")
+    return True
+
+
 def test_portal_navigation():
     """Test portal navigation is called."""
     log = get_logger()
@@ -227,9 +249,9 @@ def test_exit_game_called():
 
     run.execute()
 
-    # Should have pressed escape (for save & exit)
-    calls = input_ctrl.press.call_args_list
-    keys = [c[0][0] for c in calls]
+    # Should have pressed escape (for save & exit, sent as one sequence)
+    steps = [s for c in input_ctrl.send_sequence.call_args_list for s in c[0][0]]
+    keys = [arg for action, arg, _ in steps if action == "press"]
 
     escape_count = keys.count("escape")
     assert escape_count >= 2  # Escape pressed twice for save & exit
@@ -330,6 +352,29 @@ def test_statistics_tracking():
     return True
 
 
+def test_average_run_time_successful_only():
+    """Test average run time only counts successful runs."""
+    log = get_logger()
+    log.info("Testing average run time...")
+
+    run, _, _, _, _, _ = create_mock_pindle_run()
+    run.health = None
+
+    with patch.object(PindleRun, "_execute_run", return_value=RunResult(status=RunStatus.SUCCESS)):
+        run.execute()
+    with patch.object(PindleRun, "_execute_run", return_value=RunResult(status=RunStatus.ERROR)):
+        run.execute()
+
+    assert run.get_run_count() == 2
+    assert run.get_success_count() == 1
+    expected = run.get_run_history()[0].run_time
+    assert run.get_average_run_time() == expected
+    assert all(r.timestamp > 0 for r in run.get_run_history())
+
+    log.info("PASSED: average run time")
+    return True
+
+
 def test_callbacks_called():
     """Test callbacks are invoked."""
     log = get_logger()
@@ -363,6 +408,12 @@ def test_find_pindleskin():
     pos = run.find_pindleskin(Mock())
     assert pos == (960, 250)
 
+    # With a matcher, uses the first template match
+    run.matcher = Mock()
+    run.matcher.find_any.return_value = ("monsters/pindle_name", Mock(center=(900, 260)))
+    assert run.find_pindleskin(Mock()) == (900, 260)
+    assert run.matcher.find_any.call_args[0][1] == PindleRun.PINDLE_TEMPLATES
+
     # Without detector, returns None
     run.detector = None
     pos = run.find_pindleskin(Mock())
@@ -388,7 +439,7 @@ def test_run_result_dataclass():
     assert result.run_time == 15.5
     assert result.kills == 1
     assert result.items_picked == 3
-    assert result.timestamp > 0
+    assert result.timestamp == 0.0  # Stamped by execute()
 
     log.info("PASSED: RunResult")
     return True
@@ -455,6 +506,81 @@ def test_run_without_health_monitor():
     return True
 
 
+def test_profile_runs_dumps_stats():
+    """Test profile_runs writes a cProfile dump and phase timers accumulate."""
+    log = get_logger()
+    log.info("Testing run profiling...")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config()
+        config.profile_runs = True
+        config.log_dir = tmpdir
+
+        run = PindleRun(config=config, input_ctrl=Mock(), combat=None)
+        run.portal_load_time = 0.01
+        run.wait_for_loot = 0.01
+
+        result = run.execute()
+
+        assert result.status == RunStatus.SUCCESS
+        profiles = list((Path(tmpdir) / "profiles").glob("pindleskin_*.prof"))
+        assert len(profiles) == 1
+        phases = run.get_phase_times()
+        assert set(phases) == {"combat", "loot"}
+        assert phases["loot"] >= 0.01
+
+    log.info("PASSED: run profiling")
+    return True
+
+
+def test_wait_for_frame_stable():
+    """Test settle waits return early once the screen stops changing."""
+    log = get_logger()
+    log.info("Testing frame-stable wait...")
+
+    capture = Mock()
+    capture.grab.return_value = np.full((1080, 1920, 3), 40, dtype=np.uint8)
+    run = PindleRun(config=Config(), input_ctrl=Mock(), screen_capture=capture)
+
+    start = time.time()
+    assert run._wait_for_frame_stable(1.0, poll=0.01) is True
+    elapsed = time.time() - start
+    assert elapsed >= 0.5, "Should dwell before the first comparison"
+    assert elapsed < 0.8, "Static screen should settle right after the dwell"
+    capture.grab.assert_called_with(use_cache=False)
+
+    # Without usable frames, falls back to the full delay
+    run.capture = None
+    start = time.time()
+    assert run._wait_for_frame_stable(0.05) is True
+    assert time.time() - start >= 0.05
+
+    log.info("PASSED: frame-stable wait")
+    return True
+
+
+def test_settle_after_per_skill():
+    """Test post-cast waits use per-skill times, defaulting to cast_settle_time."""
+    log = get_logger()
+    log.info("Testing per-skill settle times...")
+
+    run = PindleRun(config=Config(), input_ctrl=Mock())
+    run._wait_for_frame_stable = Mock(return_value=True)
+    run.cast_settle_time = 0.3
+
+    run._settle_after(Skill.STATIC_FIELD)
+    assert run._wait_for_frame_stable.call_args[0][0] == 0.12
+
+    run._settle_after(Skill.BLIZZARD)
+    assert run._wait_for_frame_stable.call_args[0][0] == 0.3
+
+    run._settle_after(Skill.NOVA)
+    assert run._wait_for_frame_stable.call_args[0][0] == 0.3
+
+    log.info("PASSED: per-skill settle times")
+    return True
+
+
 def run_all_tests():
     """Run all Pindleskin run tests."""
     setup_logger(level="INFO")
@@ -469,6 +595,7 @@ def run_all_tests():
         ("Execute Success", test_execute_success),
         ("Run History", test_execute_records_history),
         ("Chicken Abort", test_chicken_triggers_abort),
+        ("Check Health Reads Chicken Flag", test_check_health_reads_chicken_flag),
         ("Portal Navigation", test_portal_navigation),
         ("Combat Execution", test_combat_execution),
         ("Teleport to Pindle", test_teleport_to_pindle),
@@ -479,11 +606,15 @@ def run_all_tests():
         ("Run Abort", test_run_abort),
         ("Timeout Check", test_run_timeout_check),
         ("Statistics", test_statistics_tracking),
+        ("Average Run Time", test_average_run_time_successful_only),
         ("Callbacks", test_callbacks_called),
         ("Find Pindleskin", test_find_pindleskin),
         ("RunResult Dataclass", test_run_result_dataclass),
         ("Run Without Combat", test_run_without_combat),
         ("Run Without Health Monitor", test_run_without_health_monitor),
+        ("Profile Runs", test_profile_runs_dumps_stats),
+        ("Wait For Frame Stable", test_wait_for_frame_stable),
+        ("Settle After Per Skill", test_settle_after_per_skill),
     ]
 
     passed = 0
@@ -1,6 +1,7 @@
 """Unit tests for screen capture module (no display required)."""
 
 import time
+from typing import Optional
 from unittest.mock import Mock, patch, MagicMock
 
 import numpy as np
@@ -9,13 +10,16 @@ from src.vision.screen_capture import ScreenCapture
 from src.utils.logger import setup_logger, get_logger
 
 
-def create_mock_screenshot(width: int = 1920, height: int = 1080):
+def create_mock_screenshot(width: int = 1920, height: int = 1080, fill: Optional[int] = None):
     """Create a mock screenshot for testing."""
     # Create a simple gradient image
     img = np.zeros((height, width, 4), dtype=np.uint8)
-    img[:, :, 0] = 255  # Blue channel
-    img[:, :, 1] = 128  # Green channel
-    img[:, :, 2] = 64   # Red channel
+    if fill is not None:
+        img[:, :, :3] = fill
+    else:
+        img[:, :, 0] = 255  # Blue channel
+        img[:, :, 1] = 128  # Green channel
+        img[:, :, 2] = 64   # Red channel
     img[:, :, 3] = 255  # Alpha channel
 
     # Create mock with pixel array
@@ -187,6 +191,92 @@ def test_is_game_running():
     return True
 
 
+def test_grab_gray_converts_once():
+    """Test grab_gray() reuses the conversion for a cached frame."""
+    log = get_logger()
+    log.info("Testing grayscale frame cache...")
+
+    with patch("src.vision.screen_capture.mss"):
+        capture = ScreenCapture(cache_duration=10.0)
+        capture._find_window = Mock(return_value=None)
+        capture.sct.monitors = [None, {"left": 0, "top": 0, "width": 100, "height": 100}]
+        capture.sct.grab.return_value = create_mock_screenshot(100, 100)
+
+        gray1 = capture.grab_gray()
+        gray2 = capture.grab_gray()
+        assert gray1.shape == (100, 100), "Gray frame should be single-channel"
+        assert gray1 is gray2, "Same frame should reuse its conversion"
+
+        capture.sct.grab.return_value = create_mock_screenshot(100, 100, fill=0)
+        capture.invalidate_cache()
+        gray3 = capture.grab_gray()
+        assert not gray3.any(), "New frame should be converted again"
+        assert capture.sct.grab.call_count == 2
+
+    log.info("PASSED: Grayscale frame cache")
+    return True
+
+
+def test_grab_returns_independent_frames():
+    """Test each capture returns its own array, so held frames stay valid."""
+    log = get_logger()
+    log.info("Testing independent frames...")
+
+    with patch("src.vision.screen_capture.mss"):
+        capture = ScreenCapture()
+        capture._find_window = Mock(return_value=None)
+        capture.sct.monitors = [None, {"left": 0, "top": 0, "width": 100, "height": 100}]
+        capture.sct.grab.return_value = create_mock_screenshot(100, 100)
+
+        first = capture.grab(use_cache=False)
+        assert first.shape == (100, 100, 3), "Frame should be BGR"
+        assert tuple(first[0, 0]) == (255, 128, 64)
+
+        capture.sct.grab.return_value = create_mock_screenshot(100, 100, fill=0)
+        for _ in range(4):
+            capture.grab(use_cache=False)
+        assert tuple(first[0, 0]) == (255, 128, 64), "Held frame should not be overwritten"
+
+    log.info("PASSED: Independent frames")
+    return True
+
+
+def test_stream_latest_frame():
+    """Test grab() reads the background stream when it is running."""
+    log = get_logger()
+    log.info("Testing capture stream...")
+
+    frame = np.zeros((100, 100, 3), dtype=np.uint8)
+    camera = Mock()
+    camera.get_latest_frame.return_value = frame
+    fake_bettercam = Mock()
+    fake_bettercam.create.return_value = camera
+
+    with patch("src.vision.screen_capture.mss"), \
+            patch("src.vision.screen_capture.HAS_BETTERCAM", True), \
+            patch("src.vision.screen_capture.bettercam", fake_bettercam, create=True):
+        capture = ScreenCapture()
+        capture._find_window = Mock(return_value=None)
+
+        assert capture.start_stream(target_fps=30) is True
+        assert capture.is_streaming()
+        camera.start.assert_called_once_with(region=None, target_fps=30, video_mode=True)
+
+        assert capture.grab(use_cache=False) is frame
+        capture.sct.grab.assert_not_called()
+
+        capture.stop_stream()
+        camera.stop.assert_called_once()
+        assert not capture.is_streaming()
+
+    with patch("src.vision.screen_capture.mss"), \
+            patch("src.vision.screen_capture.HAS_BETTERCAM", False):
+        assert ScreenCapture().start_stream() is False
+
+    log.info("PASSED: Capture stream")
+    return True
+
+
 def run_all_tests():
     """Run all unit tests."""
     setup_logger(level="INFO")
@@ -204,6 +294,9 @@ def run_all_tests():
         ("Region Monitor Building", test_region_monitor_building),
         ("Window Detection Fallback", test_window_detection_fallback),
         ("Is Game Running", test_is_game_running),
+        ("Grab Gray Converts Once", test_grab_gray_converts_once),
+        ("Grab Returns Independent Frames", test_grab_returns_independent_frames),
+        ("Stream Latest Frame", test_stream_latest_frame),
     ]
 
     passed = 0
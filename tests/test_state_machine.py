@@ -1,5 +1,6 @@
 """Tests for the bot state machine."""
 
+import threading
 import time
 from src.state_machine import (
     BotState,
@@ -290,6 +291,112 @@ def test_wait_for_state():
     return True
 
 
+def test_wait_for_state_wakes_on_transition():
+    """Test wait_for_state returns as soon as the state changes."""
+    log = get_logger()
+    log.info("Testing wait_for_state wakeup...")
+
+    sm = BotStateMachine()
+    sm.transition_to(BotState.STARTING, force=True)
+
+    timer = threading.Timer(0.02, sm.transition_to, args=(BotState.IN_TOWN,))
+    start = time.monotonic()
+    timer.start()
+    assert sm.wait_for_state(BotState.IN_TOWN, timeout=1.0)
+    elapsed = time.monotonic() - start
+    timer.join()
+
+    assert elapsed < 0.08, f"Woke after {elapsed:.3f}s"
+    assert not sm.wait_for_state(BotState.LOOTING, timeout=0.05)
+
+    log.info("PASSED: wait_for_state wakeup")
+    return True
+
+
+def test_handlers_serialized_without_blocking_waiters():
+    """Test slow entry handlers keep transitions ordered but don't block waiters."""
+    log = get_logger()
+    log.info("Testing handler serialization...")
+
+    sm = BotStateMachine()
+    entered = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def slow_entry(prev, new):
+        entered.set()
+        release.wait(1.0)
+        order.append("entry STARTING")
+
+    sm.register_handler(
+        BotState.STARTING,
+        lambda: None,
+        on_entry=slow_entry,
+        on_exit=lambda prev, new: order.append(f"exit {sm.state.name}"),
+    )
+
+    worker = threading.Thread(
+        target=sm.transition_to, args=(BotState.STARTING,), daemon=True
+    )
+    worker.start()
+    assert entered.wait(1.0)
+
+    # State already swapped, so the waiter returns while the entry handler runs
+    start = time.monotonic()
+    assert sm.wait_for_state(BotState.STARTING, timeout=0.1)
+    assert time.monotonic() - start < 0.5, "Waiter blocked behind entry handler"
+
+    # A waiter for another state still times out on schedule
+    start = time.monotonic()
+    assert not sm.wait_for_state(BotState.LOOTING, timeout=0.1)
+    assert time.monotonic() - start < 0.5, "Waiter timeout stretched by entry handler"
+
+    # A concurrent transition waits for the entry handler to finish
+    other = threading.Thread(
+        target=sm.transition_to, args=(BotState.IN_TOWN,), daemon=True
+    )
+    other.start()
+    other.join(0.1)
+    assert other.is_alive(), "Transition overtook a running entry handler"
+    assert sm.state == BotState.STARTING
+
+    release.set()
+    worker.join(1.0)
+    other.join(1.0)
+    assert sm.state == BotState.IN_TOWN
+    # Exit handler runs before the swap, after the entry handler finished
+    assert order == ["entry STARTING", "exit STARTING"]
+
+    log.info("PASSED: handler serialization")
+    return True
+
+
+def test_tick_rate_not_stretched_by_handler():
+    """Test slow handlers don't add to the tick period."""
+    log = get_logger()
+    log.info("Testing tick scheduling...")
+
+    sm = BotStateMachine(tick_rate=0.05)
+    ticks = []
+
+    def slow_handler():
+        ticks.append(time.monotonic())
+        time.sleep(0.03)
+
+    sm.register_handler(BotState.STARTING, slow_handler)
+    sm.start()
+    time.sleep(0.5)
+    sm.stop()
+
+    # Handler time (0.03s) is absorbed by the 0.05s period
+    intervals = [b - a for a, b in zip(ticks, ticks[1:])]
+    average = sum(intervals) / len(intervals)
+    assert average < 0.065, f"Average tick interval {average:.3f}s"
+
+    log.info("PASSED: tick scheduling")
+    return True
+
+
 def test_all_states_have_transitions():
     """Verify all states have defined transitions."""
     log = get_logger()
@@ -343,6 +450,9 @@ def run_all_tests():
         ("Synchronous Run", test_synchronous_run),
         ("Error Handling", test_error_state_on_exception),
         ("Wait For State", test_wait_for_state),
+        ("Wait For State Wakeup", test_wait_for_state_wakes_on_transition),
+        ("Handlers Serialized", test_handlers_serialized_without_blocking_waiters),
+        ("Tick Rate Not Stretched", test_tick_rate_not_stretched_by_handler),
         ("Transition Completeness", test_all_states_have_transitions),
         ("STOPPING Reachability", test_stopping_always_reachable),
     ]
@@ -87,6 +87,11 @@ def test_template_loading():
     missing = matcher.load_template("nonexistent")
     assert missing is None, "Missing template should return None"
 
+    # Missing template is remembered until the cache is cleared
+    assert "nonexistent" in matcher._missing
+    matcher.clear_cache()
+    assert not matcher._missing
+
     log.info("PASSED: Template loading")
     return True
 
@@ -115,6 +120,43 @@ def test_single_match():
     return True
 
 
+def test_find_cached():
+    """Test matching a preloaded grayscale template."""
+    log = get_logger()
+    log.info("Testing find_cached...")
+
+    matcher = TemplateMatcher(template_dir=str(TEST_ASSETS_DIR))
+    screen = cv2.imread(str(TEST_ASSETS_DIR / "test_screen.png"))
+
+    template = matcher.get_template_gray("pattern")
+    assert template is not None, "Pattern template should load"
+    assert template.ndim == 2, "Cached template should be grayscale"
+
+    match = matcher.find_cached(screen, template, threshold=0.9)
+    expected = matcher.find(screen, "pattern", threshold=0.9)
+    assert match is not None, "Should find pattern"
+    assert (match.x, match.y) == (expected.x, expected.y)
+
+    assert matcher.get_template_gray("nonexistent") is None
+
+    # Coarse-to-fine search lands exactly on one of the pattern copies
+    coarse = matcher.find_cached(screen, template, threshold=0.9, downscale=2)
+    assert coarse is not None, "Should find pattern with downscale"
+    assert coarse.confidence > 0.95, f"Confidence should be high: {coarse.confidence}"
+    x1, y1, x2, y2 = coarse.rect
+    found = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY)[y1:y2, x1:x2]
+    assert np.array_equal(found, template), "Coarse match should be exact"
+
+    # A coarse score below coarse_threshold skips the full-resolution pass
+    blank = np.full_like(screen, 50)
+    assert matcher.find_cached(
+        blank, template, threshold=0.0, downscale=2, coarse_threshold=0.55
+    ) is None
+
+    log.info("PASSED: find_cached")
+    return True
+
+
 def test_multi_match():
     """Test finding multiple template matches."""
     log = get_logger()
@@ -312,6 +354,7 @@ def run_all_tests():
         ("Match Dataclass", test_match_dataclass),
         ("Template Loading", test_template_loading),
         ("Single Match", test_single_match),
+        ("Find Cached", test_find_cached),
         ("Multi Match", test_multi_match),
         ("Threshold Filtering", test_threshold_filtering),
         ("No Match Scenario", test_no_match),
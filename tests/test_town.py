@@ -1,9 +1,12 @@
 """Tests for town navigation and NPC interaction."""
 
+import time
 from unittest.mock import Mock
 from dataclasses import dataclass
 from typing import Tuple
 
+import numpy as np
+
 from src.game.town import (
     TownManager,
     Act,
@@ -11,6 +14,7 @@ from src.game.town import (
     NPC_TEMPLATES,
     OBJECT_TEMPLATES,
     SCREEN_POSITIONS,
+    FALLBACK_POSITIONS,
 )
 from src.data.models import Config
 from src.utils.logger import setup_logger, get_logger
@@ -397,11 +401,228 @@ def test_screen_positions_defined():
     for pos in expected_positions:
         assert pos in SCREEN_POSITIONS, f"Missing fallback position: {pos}"
 
+    # Tuple-keyed view used by the lookups mirrors the named table
+    assert FALLBACK_POSITIONS[(5, "malah")] == SCREEN_POSITIONS["act5_malah"]
+    assert FALLBACK_POSITIONS[(5, "red_portal")] == SCREEN_POSITIONS["act5_red_portal"]
+    assert len(FALLBACK_POSITIONS) == len(SCREEN_POSITIONS)
+
     log.info(f"Verified {len(expected_positions)} fallback positions")
     log.info("PASSED: fallback positions")
     return True
 
 
+def test_shared_frame():
+    """Test searches share one grab until input is sent."""
+    log = get_logger()
+    log.info("Testing shared frame...")
+
+    manager, input_ctrl, matcher, capture = create_mock_town_manager()
+
+    # Back-to-back searches use one frame
+    manager.find_object("red_portal")
+    manager.find_npc(NPC.ANYA)
+    assert capture.grab.call_count == 1
+    assert matcher.find.call_count == 2
+
+    # Input invalidates the frame
+    manager.move_to(100, 100)
+    manager.find_object("stash")
+    assert capture.grab.call_count == 2
+
+    # Explicit frame skips the grab
+    frame = Mock()
+    manager.find_npc(NPC.MALAH, screen=frame)
+    assert capture.grab.call_count == 2
+    assert matcher.find.call_args[0][0] is frame
+
+    log.info("PASSED: shared frame")
+    return True
+
+
+def test_find_dialog_option():
+    """Test finding any of several dialog options in one pass."""
+    log = get_logger()
+    log.info("Testing dialog option search...")
+
+    manager, _, matcher, capture = create_mock_town_manager()
+
+    matcher.find_any.return_value = ("dialog/repair", MockMatch(300, 400))
+    result = manager.find_dialog_option(["trade", "repair", "bogus"])
+
+    assert result == ("repair", (350, 425))
+    matcher.find_any.assert_called_once()
+    assert matcher.find_any.call_args[0][1] == ["dialog/trade", "dialog/repair"]
+    assert capture.grab.call_count == 1
+
+    matcher.find_any.return_value = None
+    assert manager.find_dialog_option(["heal"]) is None
+
+    log.info("PASSED: dialog option search")
+    return True
+
+
+def test_templates_preloaded():
+    """Test town templates are loaded once at init."""
+    log = get_logger()
+    log.info("Testing template preload...")
+
+    _, _, matcher, _ = create_mock_town_manager()
+
+    matcher.preload_templates.assert_called_once()
+    preloaded = matcher.preload_templates.call_args[0][0]
+    assert "npcs/malah" in preloaded
+    assert "hud/stash" in preloaded
+    assert "dialog/repair" in preloaded
+
+    log.info("PASSED: template preload")
+    return True
+
+
+def test_wait_for_panel():
+    """Test panel waits poll until the template shows up."""
+    log = get_logger()
+    log.info("Testing panel wait...")
+
+    manager, _, matcher, capture = create_mock_town_manager()
+    manager.interact_delay = 5.0
+
+    # Found on the second poll; returns without the fixed delay
+    matcher.find.side_effect = [None, MockMatch(0, 0)]
+    start = time.monotonic()
+    assert manager._wait_for("stash", timeout=1.0, interval=0.01) is True
+    assert time.monotonic() - start < 0.5
+    assert capture.grab.call_count == 2
+
+    # Never found: gives up at the timeout
+    matcher.find.side_effect = None
+    matcher.find.return_value = None
+    assert manager._wait_for("dialog", timeout=0.05, interval=0.01) is False
+
+    # Missing template falls back to the fixed delay
+    manager.interact_delay = 0.01
+    matcher.load_template.return_value = None
+    assert manager._wait_for("waypoint") is True
+
+    log.info("PASSED: panel wait")
+    return True
+
+
+def test_panel_not_opened_returns_false():
+    """Test interactions report failure when their panel never shows."""
+    log = get_logger()
+    log.info("Testing unopened panels...")
+
+    manager, _, matcher, _ = create_mock_town_manager()
+    manager.dialog_timeout = 0.05
+    manager.find_npc = Mock(return_value=(400, 200))
+    manager.find_object = Mock(return_value=(100, 200))
+    matcher.find.return_value = None
+
+    assert manager.interact_with_npc(NPC.MALAH) is False
+    assert manager.open_stash() is False
+    assert manager.use_waypoint() is False
+
+    log.info("PASSED: unopened panels")
+    return True
+
+
+def test_find_npc_searches_near_fallback():
+    """Test NPC search looks around the expected position first."""
+    log = get_logger()
+    log.info("Testing NPC search window...")
+
+    manager, _, matcher, capture = create_mock_town_manager()
+    manager.current_act = Act.ACT5
+    capture.grab.return_value = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    # Found inside the window: position is offset back to screen coords
+    matcher.find.return_value = MockMatch(100, 50)
+    pos = manager.find_npc(NPC.MALAH)
+
+    # act5_malah is (450, 130): window starts at (300, 0)
+    roi = matcher.find.call_args[0][0]
+    assert roi.shape[:2] == (280, 300)
+    assert pos == (300 + 150, 0 + 75)
+    assert matcher.find.call_count == 1
+
+    # Not in the window: falls through to a full-frame search
+    manager.invalidate_frame()
+    matcher.find.side_effect = [None, MockMatch(1000, 600)]
+    pos = manager.find_npc(NPC.MALAH)
+
+    assert matcher.find.call_args[0][0].shape[:2] == (1080, 1920)
+    assert pos == (1050, 625)
+
+    log.info("PASSED: NPC search window")
+    return True
+
+
+def test_town_routine_visits_each_npc_once():
+    """Test town routine goes to each NPC only once."""
+    log = get_logger()
+    log.info("Testing town routine NPC visits...")
+
+    manager, input_ctrl, matcher, _ = create_mock_town_manager()
+    matcher.load_template.return_value = None
+    matcher.find.return_value = MockMatch(400, 200)
+
+    assert manager.town_routine() is True
+
+    # One teleport each to the healer and Cain
+    assert input_ctrl.right_click.call_count == 2
+
+    log.info("PASSED: town routine NPC visits")
+    return True
+
+
+def test_settle_deferred_to_next_action():
+    """Test settle delays are waited out by the next action, not inline."""
+    log = get_logger()
+    log.info("Testing deferred settle...")
+
+    manager, input_ctrl, _, _ = create_mock_town_manager()
+
+    # Returns without blocking on the movement settle
+    start = time.monotonic()
+    manager.move_to(500, 300)
+    assert time.monotonic() - start < 0.1
+
+    # The next input waits for the remainder
+    manager.close_stash()
+    assert time.monotonic() - start >= 0.3
+    input_ctrl.press.assert_called_with("escape")
+
+    log.info("PASSED: deferred settle")
+    return True
+
+
+def test_search_window_follows_last_match():
+    """Test the search window is centred on the last match."""
+    log = get_logger()
+    log.info("Testing search window follows last match...")
+
+    manager, _, matcher, capture = create_mock_town_manager()
+    manager.current_act = Act.ACT5
+    capture.grab.return_value = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+    # First seen far from its fallback, via the full frame
+    matcher.find.side_effect = [None, MockMatch(950, 475)]
+    assert manager.find_npc(NPC.MALAH) == (1000, 500)
+
+    # Next search looks around (1000, 500) first
+    manager.invalidate_frame()
+    matcher.find.side_effect = [MockMatch(100, 100)]
+    assert manager.find_npc(NPC.MALAH) == (850 + 150, 350 + 125)
+    assert matcher.find.call_args[0][0].shape[:2] == (300, 300)
+
+    # Changing act forgets it
+    manager.set_act(Act.ACT5)
+    assert manager._last_seen == {}
+
+    log.info("PASSED: search window follows last match")
+    return True
+
+
 def run_all_tests():
     """Run all town navigation tests."""
     setup_logger(level="INFO")
@@ -432,6 +653,15 @@ def run_all_tests():
         ("NPC Template Definitions", test_npc_templates_defined),
         ("Object Template Definitions", test_object_templates_defined),
         ("Fallback Positions", test_screen_positions_defined),
+        ("Shared Frame", test_shared_frame),
+        ("Find Dialog Option", test_find_dialog_option),
+        ("Templates Preloaded", test_templates_preloaded),
+        ("Wait For Panel", test_wait_for_panel),
+        ("Panel Not Opened", test_panel_not_opened_returns_false),
+        ("Find NPC Searches Near Fallback", test_find_npc_searches_near_fallback),
+        ("Town Routine Visits Each NPC Once", test_town_routine_visits_each_npc_once),
+        ("Settle Deferred To Next Action", test_settle_deferred_to_next_action),
+        ("Search Window Follows Last Match", test_search_window_follows_last_match),
     ]
 
     passed = 0